@@ -0,0 +1,49 @@
+"""
+Benchmark the path normalizer against a PurePosixPath-based variant.
+
+Usage: python scripts/bench_path.py
+"""
+
+import timeit
+
+from pathlib import PurePosixPath
+
+from flysystem.path import WhitespacePathNormalizer, _normalize_impl
+
+PATHS = (
+    "a/b/c.txt",
+    "/dirname/subdir/subsubdir",
+    "resources/tmp/tmp.txt",
+    "/dirname//subdir///subsubdir",
+    "\\example\\..\\path.txt",
+    "./dir/../././",
+    "00004869/files/other/10-75..stl",
+)
+
+NUMBER = 100_000
+
+
+def _pathlib_normalize(path: str) -> str:
+    if "\\" in path:
+        path = path.replace("\\", "/")
+    result = str(PurePosixPath(path))
+    if result == ".":
+        return ""
+    return result
+
+
+def main() -> None:
+    normalizer = WhitespacePathNormalizer()
+    for path in PATHS:
+        current = timeit.timeit(lambda: normalizer.normalize(path), number=NUMBER)
+        uncached = timeit.timeit(lambda: _normalize_impl.__wrapped__(path), number=NUMBER)
+        pathlib_based = timeit.timeit(lambda: _pathlib_normalize(path), number=NUMBER)
+        print(
+            f"{path!r:40s} current={current / NUMBER * 1e9:7.0f}ns "
+            f"uncached={uncached / NUMBER * 1e9:7.0f}ns "
+            f"pathlib={pathlib_based / NUMBER * 1e9:7.0f}ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
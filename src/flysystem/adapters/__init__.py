@@ -2,11 +2,12 @@
 Module flysystem.adapters
 """
 
-from abc import ABCMeta, abstractmethod
-from typing import IO, Any, Dict, List
+from abc import abstractmethod
+from typing import IO, Any, Dict, List, Protocol, runtime_checkable
 
 
-class FilesystemAdapter(metaclass=ABCMeta):
+@runtime_checkable
+class FilesystemAdapter(Protocol):
     """
     FilesystemAdapter interface
     """
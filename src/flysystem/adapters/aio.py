@@ -0,0 +1,188 @@
+"""
+Module flysystem.adapters
+"""
+
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import IO, Any, Dict, List
+
+from ..adapters import FilesystemAdapter
+
+
+class AsyncFilesystemAdapter:
+    """
+    Asynchronous wrapper around any FilesystemAdapter.
+
+    Delegates every call to the wrapped adapter in a thread pool so that
+    asyncio callers can overlap many blocking filesystem operations, e.g.
+    ``await asyncio.gather(*[fs.a_read(p) for p in paths])``.
+    """
+
+    def __init__(self, adapter: FilesystemAdapter, max_workers: int = None) -> None:
+        self.adapter = adapter
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def a_file_exists(self, path: str) -> bool:
+        """
+        Determine if a file exists.
+        Arguments:
+            path: The file path
+        Returns:
+            True if the file existed
+        """
+        return await self._run(self.adapter.file_exists, path)
+
+    async def a_directory_exists(self, path: str) -> bool:
+        """
+        Determine if a directory exists.
+        Arguments:
+            path: The directory path
+        Returns:
+            True if the directory existed
+        """
+        return await self._run(self.adapter.directory_exists, path)
+
+    async def a_write(self, path: str, contents: str, options: Dict[str, Any] = None):
+        """
+        Write the contents of a file.
+        Arguments:
+            path: The file path
+            contents: The contents to write
+            options: Write options
+        Returns:
+            None
+        """
+        return await self._run(self.adapter.write, path, contents, options)
+
+    async def a_write_stream(self, path: str, resource: IO, options: Dict[str, Any] = None):
+        """
+        Write the contents of a file from stream
+        Arguments:
+            path: The file path
+            resource: The stream
+            options: Write options
+        Returns:
+            None
+        """
+        return await self._run(self.adapter.write_stream, path, resource, options)
+
+    async def a_read(self, path: str) -> str:
+        """
+        Get the contents of a file.
+        Arguments:
+            path: The file path
+        Returns:
+            The contents of file as string
+        """
+        return await self._run(self.adapter.read, path)
+
+    async def a_read_stream(self, path: str) -> IO:
+        """
+        Read the contents of a file as stream
+        Arguments:
+            path: The file path
+        Returns:
+            The contents of file as stream
+        """
+        return await self._run(self.adapter.read_stream, path)
+
+    async def a_delete(self, path: str):
+        """
+        Delete a file
+        Arguments:
+            path: The file path
+        Returns:
+            None
+        """
+        return await self._run(self.adapter.delete, path)
+
+    async def a_delete_directory(self, path: str):
+        """
+        Recursively delete a directory.
+        Arguments:
+            path: Directory path to delete
+        Returns:
+            True if the directory is deleted successfully
+        """
+        return await self._run(self.adapter.delete_directory, path)
+
+    async def a_create_directory(self, path: str, options: Dict[str, Any] = None):
+        """
+        Create a directory.
+        Arguments:
+            path: Directory path to create
+            options: Options for create
+        Returns:
+            True if the directory is created successfully
+        """
+        return await self._run(self.adapter.create_directory, path, options)
+
+    async def a_file_size(self, path: str) -> int:
+        """
+        Get size of file
+        Arguments:
+            path: The file path
+        Returns:
+            The file size in bytes
+        """
+        return await self._run(self.adapter.file_size, path)
+
+    async def a_mime_type(self, path: str) -> str:
+        """
+        Get mimetype of file
+        Arguments:
+            path: The file path
+        Returns:
+            The file's mimetype
+        """
+        return await self._run(self.adapter.mime_type, path)
+
+    async def a_last_modified(self, path: str) -> int:
+        """
+        Get last modified time
+        Arguments:
+            path: The file path
+        Returns:
+            The file's last modified time as timestamp
+        """
+        return await self._run(self.adapter.last_modified, path)
+
+    async def a_list_contents(self, path: str) -> List[str]:
+        """
+        Get all (recursive) of the directories within a given directory.
+        Arguments:
+            path: Directory path
+        Returns:
+            List all directories in the given directory
+        """
+        return await self._run(self.adapter.list_contents, path)
+
+    async def a_copy(self, source: str, destination: str, options: Dict[str, Any] = None):
+        """
+        Copy a file
+        Arguments:
+            source: Path to source file
+            destination: Path to destination file
+            options: Copy options
+        Returns:
+            None
+        """
+        return await self._run(self.adapter.copy, source, destination, options)
+
+    async def a_move(self, source: str, destination: str, options: Dict[str, Any] = None):
+        """
+        Move a file
+        Arguments:
+            source: Path to source file
+            destination: Path to destination file
+            options: Move options
+        Returns:
+            None
+        """
+        return await self._run(self.adapter.move, source, destination, options)
@@ -1,8 +1,13 @@
+import errno
 import mimetypes
+import os
 import shutil
+import stat
+import time
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import IO, Any, Dict, List
+from typing import IO, Any, Dict, Iterator, List
 
 from ..adapters import FilesystemAdapter
 from ..error import (
@@ -15,7 +20,115 @@ from ..error import (
     UnableToRetrieveMetadata,
     UnableToWriteFile,
 )
-from ..visibility import PortableUnixVisibilityConverter, UnixVisibilityConverter
+from ..visibility import PortableUnixVisibilityConverter, UnixVisibilityConverter, Visibility
+
+# Initialize the mimetypes registry once at import and keep a plain dict of the
+# suffix map so the common single-extension case is a dict hit instead of the
+# pattern walk inside guess_type
+mimetypes.init()
+_MIME_TYPES_MAP = dict(mimetypes.types_map)
+_guess_type = mimetypes.guess_type
+
+# Module-level bindings for the hottest syscall wrappers: skips the os/stat
+# attribute lookup on every call in the metadata fast paths
+_os_stat = os.stat
+_S_ISREG = stat.S_ISREG
+_S_ISDIR = stat.S_ISDIR
+
+# Entry bound for the existence TTL cache; expired entries are not swept, so
+# the LRU cap keeps long-running adapters from pinning one entry per path seen
+_EXISTENCE_CACHE_MAX_ENTRIES = 4096
+
+
+def _stat_mode(path: str):
+    """
+    Get the stat mode bits for a path in one syscall.
+    Arguments:
+        path: The file or directory path
+    Returns:
+        The st_mode bits, or None when the path does not exist
+    """
+    try:
+        return _os_stat(path).st_mode
+    except OSError:
+        return None
+
+
+def _copy_file_range_all(src_fd: int, dst_fd: int, size: int) -> bool:
+    """
+    Copy size bytes between fds with copy_file_range.
+    Arguments:
+        src_fd: Source file descriptor
+        dst_fd: Destination file descriptor
+        size: Number of bytes to copy
+    Returns:
+        True when done, False when unsupported before any byte moved
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    copied = 0
+    while copied < size:
+        try:
+            sent = os.copy_file_range(src_fd, dst_fd, size - copied)
+        except OSError as ex:
+            # Only fall back when nothing was copied; a mid-copy failure is real
+            if copied or ex.errno not in (errno.EXDEV, errno.EINVAL, errno.ENOSYS):
+                raise
+            return False
+        if sent == 0:
+            break
+        copied += sent
+    return True
+
+
+def _sendfile_all(src_fd: int, dst_fd: int, size: int) -> bool:
+    """
+    Copy size bytes between fds with sendfile.
+    Arguments:
+        src_fd: Source file descriptor
+        dst_fd: Destination file descriptor
+        size: Number of bytes to copy
+    Returns:
+        True when done, False when unsupported before any byte moved
+    """
+    if not hasattr(os, "sendfile"):
+        return False
+    copied = 0
+    while copied < size:
+        try:
+            sent = os.sendfile(dst_fd, src_fd, copied, size - copied)
+        except OSError as ex:
+            if copied or ex.errno not in (errno.EINVAL, errno.ENOSYS):
+                raise
+            return False
+        if sent == 0:
+            break
+        copied += sent
+    return True
+
+
+def _read_write_all(src_fd: int, dst_fd: int, size: int):
+    """
+    Copy size bytes between fds with plain read/write.
+    Arguments:
+        src_fd: Source file descriptor
+        dst_fd: Destination file descriptor
+        size: Number of bytes to copy
+    Returns:
+        None
+    """
+    copied = 0
+    while copied < size:
+        chunk = os.read(src_fd, min(size - copied, 1024 * 1024))
+        if not chunk:
+            break
+        os.write(dst_fd, chunk)
+        copied += len(chunk)
+
+
+# Shared default converter: adapters that never touch visibility should not
+# each allocate their own instance
+_DEFAULT_VISIBILITY_CONVERTER = PortableUnixVisibilityConverter()
 
 
 class LocalFilesystemAdapter(FilesystemAdapter):
@@ -23,9 +136,61 @@ class LocalFilesystemAdapter(FilesystemAdapter):
     Local filesystem adapter class
     """
 
-    def __init__(self, location: str, visibility_converter: UnixVisibilityConverter = None) -> None:
+    def __init__(
+        self,
+        location: str,
+        visibility_converter: UnixVisibilityConverter = None,
+        existence_cache_ttl: float = 1.0,
+    ) -> None:
         self.root_location = location
-        self.visibility_converter = visibility_converter or PortableUnixVisibilityConverter()
+        self.visibility_converter = (
+            visibility_converter if visibility_converter is not None else _DEFAULT_VISIBILITY_CONVERTER
+        )
+        self.existence_cache_ttl = existence_cache_ttl
+        self._existence_cache: "OrderedDict[str, Any]" = OrderedDict()
+        # The converter returns a fixed mode per visibility, so resolve both once
+        # instead of going through the converter on every call
+        self._mode_by_visibility = {
+            Visibility.PUBLIC.value: self.visibility_converter.for_file(Visibility.PUBLIC),
+            Visibility.PRIVATE.value: self.visibility_converter.for_file(Visibility.PRIVATE),
+        }
+        self._visibility_by_mode = {mode: vis for vis, mode in self._mode_by_visibility.items()}
+
+    def _cached_existence(self, key: str, check) -> bool:
+        """
+        Answer an existence check from the TTL'd cache, running check(path) on miss
+        Arguments:
+            key: The cache key ("f:" or "d:" prefixed path)
+            check: Callable performing the real check
+        Returns:
+            True if the path existed
+        """
+        cached = self._existence_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < self.existence_cache_ttl:
+            self._existence_cache.move_to_end(key)
+            return cached[0]
+        exists = check(key[2:])
+        self._existence_cache[key] = (exists, now)
+        self._existence_cache.move_to_end(key)
+        if len(self._existence_cache) > _EXISTENCE_CACHE_MAX_ENTRIES:
+            self._existence_cache.popitem(last=False)
+        return exists
+
+    def _invalidate_existence(self, *paths: str):
+        """
+        Drop cached existence answers for the given paths
+        Arguments:
+            paths: The paths to invalidate (no argument clears the whole cache)
+        Returns:
+            None
+        """
+        if not paths:
+            self._existence_cache.clear()
+            return
+        for path in paths:
+            self._existence_cache.pop("f:" + path, None)
+            self._existence_cache.pop("d:" + path, None)
 
     def file_exists(self, path: str) -> bool:
         """
@@ -35,7 +200,12 @@ class LocalFilesystemAdapter(FilesystemAdapter):
         Returns:
             True if the file existed
         """
-        return Path(path).is_file()
+        return self._cached_existence("f:" + path, self._file_exists)
+
+    @staticmethod
+    def _file_exists(path: str) -> bool:
+        mode = _stat_mode(path)
+        return mode is not None and _S_ISREG(mode)
 
     def directory_exists(self, path: str) -> bool:
         """
@@ -45,7 +215,25 @@ class LocalFilesystemAdapter(FilesystemAdapter):
         Returns:
             True if the directory existed
         """
-        return Path(path).is_dir()
+        return self._cached_existence("d:" + path, self._directory_exists)
+
+    @staticmethod
+    def _directory_exists(path: str) -> bool:
+        mode = _stat_mode(path)
+        return mode is not None and _S_ISDIR(mode)
+
+    def has(self, path: str) -> bool:
+        """
+        Determine if a file or directory exists.
+        Arguments:
+            path: The file or directory path
+        Returns:
+            True if either existed
+        """
+        # One stat answers both type questions; scanning the parent directory
+        # costs a full readdir for the same information
+        mode = _stat_mode(path)
+        return mode is not None and (_S_ISREG(mode) or _S_ISDIR(mode))
 
     def write(self, path: str, contents: str, options: Dict[str, Any] = None):
         """
@@ -63,12 +251,9 @@ class LocalFilesystemAdapter(FilesystemAdapter):
             errors = options.get("errors") if options else None
             with Path(path).open(mode, encoding=encoding, errors=errors) as wfile:
                 wfile.write(contents)
-        except IsADirectoryError as ex:
-            raise UnableToWriteFile.with_location(path, str(ex))
-        except FileNotFoundError as ex:
-            raise UnableToWriteFile.with_location(path, str(ex))
-        except PermissionError as ex:
-            raise UnableToWriteFile.with_location(path, str(ex))
+            self._invalidate_existence(path)
+        except (IsADirectoryError, FileNotFoundError, PermissionError) as ex:
+            raise UnableToWriteFile.with_location(path, str(ex)) from ex
 
     def write_stream(self, path: str, resource: IO, options: Dict[str, Any] = None):
         """
@@ -86,7 +271,9 @@ class LocalFilesystemAdapter(FilesystemAdapter):
             errors = options.get("errors") if options else None
             chunk_size = options.get("chunk_size") if options else None
             with Path(path).open(mode, encoding=encoding, errors=errors) as wfile:
-                if chunk_size:
+                if "b" in mode and self._sendfile_from(wfile, resource):
+                    pass
+                elif chunk_size:
                     while True:
                         chunk = resource.read(chunk_size)
                         if not chunk:
@@ -94,12 +281,46 @@ class LocalFilesystemAdapter(FilesystemAdapter):
                         wfile.write(chunk)
                 else:
                     wfile.write(resource.read())
-        except IsADirectoryError as ex:
-            raise UnableToWriteFile.with_location(path, str(ex))
-        except FileNotFoundError as ex:
-            raise UnableToWriteFile.with_location(path, str(ex))
-        except PermissionError as ex:
-            raise UnableToWriteFile.with_location(path, str(ex))
+            self._invalidate_existence(path)
+        except (IsADirectoryError, FileNotFoundError, PermissionError) as ex:
+            raise UnableToWriteFile.with_location(path, str(ex)) from ex
+
+    @staticmethod
+    def _sendfile_from(wfile, resource) -> bool:
+        """
+        Copy a file-backed resource kernel-to-kernel with os.sendfile
+        Arguments:
+            wfile: The destination file opened in binary mode
+            resource: The source stream
+        Returns:
+            True if the copy was done, False when the resource is not file-backed
+        """
+        if not hasattr(os, "sendfile"):
+            return False
+        try:
+            src_fd = resource.fileno()
+            # Buffered sources read ahead of the consumer, so the fd can sit
+            # past resource.tell(); realign it with the stream position
+            # sendfile is expected to copy from
+            os.lseek(src_fd, resource.tell(), os.SEEK_SET)
+        except (AttributeError, OSError, ValueError):
+            return False
+        wfile.flush()
+        dst_fd = wfile.fileno()
+        copied = 0
+        try:
+            while True:
+                sent = os.sendfile(dst_fd, src_fd, None, 1024 * 1024)
+                if sent == 0:
+                    # Leave the stream agreeing with the fd (both at EOF),
+                    # as the chunked fallback would
+                    resource.seek(0, os.SEEK_END)
+                    return True
+                copied += sent
+        except OSError as ex:
+            if not copied and ex.errno in (errno.EINVAL, errno.ENOSYS):
+                return False
+            raise
 
     def read(self, path: str) -> str:
         """
@@ -110,14 +331,24 @@ class LocalFilesystemAdapter(FilesystemAdapter):
             The contents of file as string
         """
         try:
-            contents = Path(path).read_text()
-        except IsADirectoryError as ex:
-            raise UnableToReadFile.with_location(path, str(ex))
-        except FileNotFoundError as ex:
-            raise UnableToReadFile.with_location(path, str(ex))
-        except PermissionError as ex:
-            raise UnableToReadFile.with_location(path, str(ex))
-        return contents
+            fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+        except (IsADirectoryError, FileNotFoundError, PermissionError) as ex:
+            raise UnableToReadFile.with_location(path, str(ex)) from ex
+        try:
+            stat_result = os.fstat(fd)
+            if not stat.S_ISREG(stat_result.st_mode):
+                raise UnableToReadFile.with_location(path, "Is not a regular file")
+            chunks = []
+            remaining = stat_result.st_size
+            while remaining > 0:
+                chunk = os.read(fd, remaining)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+        finally:
+            os.close(fd)
+        return b"".join(chunks).decode()
 
     def read_stream(self, path: str) -> IO:
         """
@@ -129,12 +360,8 @@ class LocalFilesystemAdapter(FilesystemAdapter):
         """
         try:
             stream = Path(path).open("r")
-        except IsADirectoryError as ex:
-            raise UnableToReadFile.with_location(path, str(ex))
-        except FileNotFoundError as ex:
-            raise UnableToReadFile.with_location(path, str(ex))
-        except PermissionError as ex:
-            raise UnableToReadFile.with_location(path, str(ex))
+        except (IsADirectoryError, FileNotFoundError, PermissionError) as ex:
+            raise UnableToReadFile.with_location(path, str(ex)) from ex
         return stream
 
     def delete(self, path: str):
@@ -146,13 +373,10 @@ class LocalFilesystemAdapter(FilesystemAdapter):
             None
         """
         try:
-            Path(path).unlink()
-        except IsADirectoryError as ex:
-            raise UnableToDeleteFile.with_location(path, str(ex))
-        except FileNotFoundError as ex:
-            raise UnableToDeleteFile.with_location(path, str(ex))
-        except PermissionError as ex:
-            raise UnableToDeleteFile.with_location(path, str(ex))
+            os.unlink(path)
+            self._invalidate_existence(path)
+        except (IsADirectoryError, FileNotFoundError, PermissionError) as ex:
+            raise UnableToDeleteFile.with_location(path, str(ex)) from ex
 
     def delete_directory(self, path: str):
         """
@@ -164,12 +388,9 @@ class LocalFilesystemAdapter(FilesystemAdapter):
         """
         try:
             shutil.rmtree(path)
-        except NotADirectoryError as ex:
-            raise UnableToDeleteDirectory.with_location(path, str(ex))
-        except FileNotFoundError as ex:
-            raise UnableToDeleteDirectory.with_location(path, str(ex))
-        except PermissionError as ex:
-            raise UnableToDeleteDirectory.with_location(path, str(ex))
+            self._invalidate_existence()
+        except (NotADirectoryError, FileNotFoundError, PermissionError) as ex:
+            raise UnableToDeleteDirectory.with_location(path, str(ex)) from ex
         return True
 
     def create_directory(self, path: str, options: Dict[str, Any] = None):
@@ -183,6 +404,7 @@ class LocalFilesystemAdapter(FilesystemAdapter):
         """
         try:
             Path(path).mkdir(parents=True, exist_ok=True)
+            self._invalidate_existence(path)
         except OSError as ex:
             raise UnableToCreateDirectory.with_location(path, str(ex))
         return True
@@ -196,8 +418,11 @@ class LocalFilesystemAdapter(FilesystemAdapter):
         Returns:
             None
         """
-        # Path(path).chmod(self.visibility_converter.for_file(visibility))
-        raise NotImplementedError
+        Visibility.validate(visibility)
+        try:
+            os.chmod(path, self._mode_by_visibility[visibility])
+        except (FileNotFoundError, PermissionError) as ex:
+            raise UnableToRetrieveMetadata.with_location(path, str(ex)) from ex
 
     def visibility(self, path: str) -> str:
         """
@@ -207,9 +432,14 @@ class LocalFilesystemAdapter(FilesystemAdapter):
         Returns:
             The file's visibility
         """
-        # visibility = S_IMODE(Path(path).stat().st_mode)
-        # return self.visibility_converter.inverse_for_file(visibility)
-        raise NotImplementedError
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError as ex:
+            raise UnableToRetrieveMetadata.with_location(path, str(ex))
+        visibility = self._visibility_by_mode.get(mode)
+        if visibility is None:
+            visibility = self.visibility_converter.inverse_for_file(mode).value
+        return visibility
 
     def file_size(self, path: str) -> int:
         """
@@ -220,11 +450,9 @@ class LocalFilesystemAdapter(FilesystemAdapter):
             The file size in bytes
         """
         try:
-            size = Path(path).stat().st_size
-        except IsADirectoryError as ex:
-            raise UnableToRetrieveMetadata.with_location(path, str(ex))
-        except FileNotFoundError as ex:
-            raise UnableToRetrieveMetadata.with_location(path, str(ex))
+            size = os.stat(path).st_size
+        except (IsADirectoryError, FileNotFoundError) as ex:
+            raise UnableToRetrieveMetadata.with_location(path, str(ex)) from ex
         return size
 
     def mime_type(self, path: str) -> str:
@@ -235,7 +463,10 @@ class LocalFilesystemAdapter(FilesystemAdapter):
         Returns:
             The file's mimetype
         """
-        mime_type, _ = mimetypes.guess_type(path)
+        mime_type = _MIME_TYPES_MAP.get("." + path.rpartition(".")[2].lower())
+        if mime_type is None:
+            # Double extensions (.tar.gz) and unknown suffixes
+            mime_type, _ = _guess_type(path)
         return mime_type
 
     def last_modified(self, path: str) -> int:
@@ -247,13 +478,30 @@ class LocalFilesystemAdapter(FilesystemAdapter):
             The file's last modified time as timestamp
         """
         try:
-            time_modified = int(Path(path).stat().st_mtime * 1000)
-        except IsADirectoryError as ex:
-            raise UnableToRetrieveMetadata.with_location(path, str(ex))
-        except FileNotFoundError as ex:
-            raise UnableToRetrieveMetadata.with_location(path, str(ex))
+            time_modified = int(os.stat(path).st_mtime * 1000)
+        except (IsADirectoryError, FileNotFoundError) as ex:
+            raise UnableToRetrieveMetadata.with_location(path, str(ex)) from ex
         return time_modified
 
+    def metadata(self, path: str) -> Dict[str, Any]:
+        """
+        Get all metadata of a file with a single stat() call
+        Arguments:
+            path: The file path
+        Returns:
+            Dict with "file_size", "last_modified", "mime_type" and "visibility" keys
+        """
+        try:
+            stat_result = os.stat(path)
+        except (IsADirectoryError, FileNotFoundError) as ex:
+            raise UnableToRetrieveMetadata.with_location(path, str(ex)) from ex
+        return {
+            "file_size": stat_result.st_size,
+            "last_modified": int(stat_result.st_mtime * 1000),
+            "mime_type": mimetypes.guess_type(path)[0],
+            "visibility": self.visibility_converter.inverse_for_file(stat.S_IMODE(stat_result.st_mode)).value,
+        }
+
     def list_contents(self, path: str) -> List[str]:
         """
         Get all (recursive) of the directories within a given directory.
@@ -262,7 +510,35 @@ class LocalFilesystemAdapter(FilesystemAdapter):
         Returns:
             List all directories in the given directory
         """
-        return [str(path_) for path_ in Path(path).rglob("*.*")]
+        return list(self.iter_contents(path))
+
+    def iter_contents(self, path: str) -> Iterator[str]:
+        """
+        Lazily yield all files (recursive) within a given directory.
+        Arguments:
+            path: Directory path
+        Returns:
+            Iterator over the file paths in the given directory
+        """
+        for root, _, files in os.walk(path):
+            for file_ in files:
+                yield os.path.join(root, file_)
+
+    def list_contents_with_stats(self, path: str) -> List[Any]:
+        """
+        Get all files (recursive) within a given directory together with their stat results.
+        Arguments:
+            path: Directory path
+        Returns:
+            List of (path, stat_result) tuples for all files in the given directory
+        """
+        results = []
+        for dirpath, _, filenames, dirfd in os.fwalk(path):
+            for name in filenames:
+                # fstatat relative to the open directory fd skips the full
+                # pathname resolution per file
+                results.append((os.path.join(dirpath, name), os.stat(name, dir_fd=dirfd, follow_symlinks=False)))
+        return results
 
     def copy(self, source: str, destination: str, options: Dict[str, Any] = None):
         """
@@ -275,11 +551,41 @@ class LocalFilesystemAdapter(FilesystemAdapter):
             None
         """
         try:
-            shutil.copy2(source, destination)
-        except IsADirectoryError as ex:
-            raise UnableToCopyFile.with_location(source, destination, str(ex))
-        except PermissionError as ex:
-            raise UnableToCopyFile.with_location(source, destination, str(ex))
+            if os.path.isdir(destination):
+                destination = os.path.join(destination, os.path.basename(source))
+            self._copy_contents(source, destination)
+            self._invalidate_existence(destination)
+        except (IsADirectoryError, FileNotFoundError, PermissionError) as ex:
+            raise UnableToCopyFile.with_location(source, destination, str(ex)) from ex
+
+    @staticmethod
+    def _copy_contents(source: str, destination: str):
+        """
+        Copy file contents with kernel-side copy_file_range/sendfile when available
+        Arguments:
+            source: Path to source file
+            destination: Path to destination file
+        Returns:
+            None
+        """
+        src_fd = os.open(source, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            stat_result = os.fstat(src_fd)
+            if not stat.S_ISREG(stat_result.st_mode):
+                raise IsADirectoryError(errno.EISDIR, "Is not a regular file", source)
+            dst_fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC)
+            try:
+                size = stat_result.st_size
+                if not _copy_file_range_all(src_fd, dst_fd, size) and not _sendfile_all(src_fd, dst_fd, size):
+                    _read_write_all(src_fd, dst_fd, size)
+                # Preserve mode and timestamps from the single fstat above (what copy2
+                # did with extra stat calls)
+                os.chmod(dst_fd, stat.S_IMODE(stat_result.st_mode))
+                os.utime(dst_fd, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
 
     def move(self, source: str, destination: str, options: Dict[str, Any] = None):
         """
@@ -292,13 +598,18 @@ class LocalFilesystemAdapter(FilesystemAdapter):
             None
         """
         try:
-            shutil.move(source, destination)
-        except IsADirectoryError as ex:
-            raise UnableToMoveFile.with_location(source, destination, str(ex))
-        except FileNotFoundError as ex:
-            raise UnableToMoveFile.with_location(source, destination, str(ex))
+            if os.path.isdir(destination):
+                shutil.move(source, destination)
+            else:
+                os.replace(source, destination)
+            self._invalidate_existence(source, destination)
         except OSError as ex:
-            raise UnableToMoveFile.with_location(source, destination, str(ex))
+            if ex.errno == errno.EXDEV:
+                # Destination is on another filesystem; rename cannot work
+                self.copy(source, destination)
+                self.delete(source)
+                return
+            raise UnableToMoveFile.with_location(source, destination, str(ex)) from ex
 
     def temporary_url(self, path: str, options: Dict[str, Any] = None) -> str:
         """
@@ -1,28 +1,40 @@
+import io
+
 from datetime import datetime
-from pathlib import Path
 from typing import IO, Any, Dict, List
 
 from typing_extensions import Self
 
 from ..adapters import FilesystemAdapter
+from ..error import (
+    UnableToCopyFile,
+    UnableToCreateDirectory,
+    UnableToMoveFile,
+    UnableToReadFile,
+    UnableToRetrieveMetadata,
+    UnableToWriteFile,
+)
 from ..visibility import Visibility
 
 
 class InMemoryFile(object):
     def __init__(self) -> None:
-        self._contents = ""
+        self._contents = bytearray()
         self._last_modified = int(datetime.now().timestamp())
-        self._visibility = Visibility.PUBLIC
+        self._visibility = Visibility.PUBLIC.value
 
     def read(self) -> str:
-        return self._contents
+        return self._contents.decode()
 
-    def read_stream(self) -> None:
-        # TODO
-        return ""
+    def read_bytes(self) -> bytes:
+        return bytes(self._contents)
+
+    def read_stream(self) -> IO:
+        return io.BytesIO(bytes(self._contents))
 
-    #     tempfile = NamedTemporaryFile()
-    #     tempfile.write
+    def append(self, data) -> None:
+        self._contents.extend(data.encode() if isinstance(data, str) else data)
+        self._last_modified = int(datetime.now().timestamp())
 
     def file_size(self) -> int:
         return len(self._contents)
@@ -37,13 +49,15 @@ class InMemoryFile(object):
     def visibility(self) -> str:
         return self._visibility
 
-    def with_contents(self, contents: str, timestamp: int = None) -> Self:
-        self._contents = contents
+    def with_contents(self, contents, timestamp: int = None) -> Self:
+        self._contents[:] = contents.encode() if isinstance(contents, str) else contents
         self._last_modified = timestamp or int(datetime.now().timestamp())
         return self
 
     def with_visibility(self, visibility: str) -> Self:
-        self._visibility = visibility
+        # Stored as the plain string so reads match the other adapters
+        # whether callers pass "public"/"private" or a Visibility member
+        self._visibility = Visibility(visibility).value
         return self
 
     def with_last_modified(self, timestamp: int) -> Self:
@@ -56,6 +70,49 @@ class InMemoryFilesystemAdapter(FilesystemAdapter):
         self.files: dict = {}
         self.default_visibility = default_visibility
 
+    def _node(self, path: str):
+        """
+        Walk the path components down the trie.
+        Arguments:
+            path: The file or directory path
+        Returns:
+            The node (dict for a directory, InMemoryFile for a file) or None when missing
+        """
+        node = self.files
+        for component in path.split("/"):
+            if not component:
+                continue
+            if not isinstance(node, dict):
+                return None
+            node = node.get(component)
+            if node is None:
+                return None
+        return node
+
+    def _parent(self, path: str, create: bool = False):
+        """
+        Resolve the parent directory node of a path.
+        Arguments:
+            path: The file or directory path
+            create: Create missing intermediate directories
+        Returns:
+            Tuple of (parent dict, leaf name) or (None, name) when the parent is missing
+        """
+        components = [component for component in path.split("/") if component]
+        if not components:
+            return None, ""
+        node = self.files
+        for component in components[:-1]:
+            child = node.get(component) if isinstance(node, dict) else None
+            if not isinstance(child, dict):
+                # Never create through an existing file: that would silently
+                # replace its contents with a directory
+                if not create or child is not None or not isinstance(node, dict):
+                    return None, components[-1]
+                child = node[component] = {}
+            node = child
+        return node, components[-1]
+
     def file_exists(self, path: str) -> bool:
         """
         Determine if a file exists.
@@ -64,8 +121,7 @@ class InMemoryFilesystemAdapter(FilesystemAdapter):
         Returns:
             True if the file exsited
         """
-        file_ = self.files.get(path)
-        return file_ is not None and isinstance(file_, InMemoryFile)
+        return isinstance(self._node(path), InMemoryFile)
 
     def directory_exists(self, path: str) -> bool:
         """
@@ -75,8 +131,7 @@ class InMemoryFilesystemAdapter(FilesystemAdapter):
         Returns:
             True if the directory exsited
         """
-        dir_ = self.files.get(path)
-        return dir_ is not None and isinstance(dir_, dict)
+        return isinstance(self._node(path), dict)
 
     def write(self, path: str, contents: str, options: Dict[str, Any] = None):
         """
@@ -88,6 +143,15 @@ class InMemoryFilesystemAdapter(FilesystemAdapter):
         Returns:
             None
         """
+        parent, name = self._parent(path, create=True)
+        if not name:
+            raise UnableToWriteFile.with_location(path, "Path is empty")
+        if parent is None:
+            raise UnableToWriteFile.with_location(path, "Parent path is not a directory")
+        file_ = parent.get(name)
+        if not isinstance(file_, InMemoryFile):
+            file_ = parent[name] = InMemoryFile().with_visibility(self.default_visibility)
+        file_.with_contents(contents)
 
     def write_stream(self, path: str, resource: IO, options: Dict[str, Any] = None):
         """
@@ -99,6 +163,7 @@ class InMemoryFilesystemAdapter(FilesystemAdapter):
         Returns:
             None
         """
+        self.write(path, resource.read(), options)
 
     def read(self, path: str) -> str:
         """
@@ -108,7 +173,10 @@ class InMemoryFilesystemAdapter(FilesystemAdapter):
         Returns:
             The contents of file as string
         """
-        return Path(path).read_text()
+        file_ = self._node(path)
+        if not isinstance(file_, InMemoryFile):
+            raise UnableToReadFile.with_location(path, "File does not exist")
+        return file_.read()
 
     def read_stream(self, path: str) -> IO:
         """
@@ -118,7 +186,10 @@ class InMemoryFilesystemAdapter(FilesystemAdapter):
         Returns:
             The contents of file as stream
         """
-        return Path(path).open("r")
+        file_ = self._node(path)
+        if not isinstance(file_, InMemoryFile):
+            raise UnableToReadFile.with_location(path, "File does not exist")
+        return file_.read_stream()
 
     def delete(self, path: str):
         """
@@ -128,7 +199,9 @@ class InMemoryFilesystemAdapter(FilesystemAdapter):
         Returns:
             None
         """
-        Path(path).unlink(missing_ok=True)
+        parent, name = self._parent(path)
+        if parent is not None and isinstance(parent.get(name), InMemoryFile):
+            del parent[name]
 
     def delete_directory(self, path: str):
         """
@@ -138,6 +211,10 @@ class InMemoryFilesystemAdapter(FilesystemAdapter):
         Returns:
             True if the directory is deleted successfully
         """
+        parent, name = self._parent(path)
+        if parent is not None and isinstance(parent.get(name), dict):
+            del parent[name]
+        return True
 
     def create_directory(self, path: str, options: Dict[str, Any] = None):
         """
@@ -148,6 +225,16 @@ class InMemoryFilesystemAdapter(FilesystemAdapter):
         Returns:
             True if the directory is created successfully
         """
+        parent, name = self._parent(path, create=True)
+        if not name:
+            return True
+        if parent is None or isinstance(parent.get(name), InMemoryFile):
+            # Same invariant as _parent: never turn an existing file into a
+            # directory, that would destroy its contents
+            raise UnableToCreateDirectory.with_location(path, "A file exists in the path")
+        if not isinstance(parent.get(name), dict):
+            parent[name] = {}
+        return True
 
     def set_visibility(self, path: str, visibility: str):
         """
@@ -158,6 +245,9 @@ class InMemoryFilesystemAdapter(FilesystemAdapter):
         Returns:
             None
         """
+        file_ = self._node(path)
+        if isinstance(file_, InMemoryFile):
+            file_.with_visibility(visibility)
 
     def visibility(self, path: str) -> str:
         """
@@ -167,6 +257,10 @@ class InMemoryFilesystemAdapter(FilesystemAdapter):
         Returns:
             The file's visibility
         """
+        file_ = self._node(path)
+        if not isinstance(file_, InMemoryFile):
+            raise UnableToRetrieveMetadata.with_location(path, "File does not exist")
+        return file_.visibility()
 
     def file_size(self, path: str) -> int:
         """
@@ -176,6 +270,10 @@ class InMemoryFilesystemAdapter(FilesystemAdapter):
         Returns:
             The file size in bytes
         """
+        file_ = self._node(path)
+        if not isinstance(file_, InMemoryFile):
+            raise UnableToRetrieveMetadata.with_location(path, "File does not exist")
+        return file_.file_size()
 
     def mime_type(self, path: str) -> str:
         """
@@ -185,6 +283,10 @@ class InMemoryFilesystemAdapter(FilesystemAdapter):
         Returns:
             The file's mimetype
         """
+        file_ = self._node(path)
+        if not isinstance(file_, InMemoryFile):
+            raise UnableToRetrieveMetadata.with_location(path, "File does not exist")
+        return file_.mime_type()
 
     def last_modified(self, path: str) -> int:
         """
@@ -194,6 +296,10 @@ class InMemoryFilesystemAdapter(FilesystemAdapter):
         Returns:
             The file's last modified time as timestamp
         """
+        file_ = self._node(path)
+        if not isinstance(file_, InMemoryFile):
+            raise UnableToRetrieveMetadata.with_location(path, "File does not exist")
+        return file_.last_modified()
 
     def list_contents(self, path: str) -> List[str]:
         """
@@ -203,6 +309,21 @@ class InMemoryFilesystemAdapter(FilesystemAdapter):
         Returns:
             List all directories in the given directory
         """
+        node = self._node(path)
+        if not isinstance(node, dict):
+            return []
+        prefix = "/".join(component for component in path.split("/") if component)
+        results = []
+        stack = [(prefix, node)]
+        while stack:
+            current, children = stack.pop()
+            for name, child in children.items():
+                child_path = current + "/" + name if current else name
+                if isinstance(child, dict):
+                    stack.append((child_path, child))
+                else:
+                    results.append(child_path)
+        return results
 
     def copy(self, source: str, destination: str, options: Dict[str, Any] = None):
         """
@@ -214,6 +335,15 @@ class InMemoryFilesystemAdapter(FilesystemAdapter):
         Returns:
             None
         """
+        file_ = self._node(source)
+        if not isinstance(file_, InMemoryFile):
+            raise UnableToCopyFile.with_location(source, destination, "File does not exist")
+        parent, name = self._parent(destination, create=True)
+        if parent is None or not name:
+            raise UnableToCopyFile.with_location(source, destination, "Invalid destination path")
+        parent[name] = (
+            InMemoryFile().with_contents(file_.read_bytes(), file_.last_modified()).with_visibility(file_.visibility())
+        )
 
     def move(self, source: str, destination: str, options: Dict[str, Any] = None):
         """
@@ -225,3 +355,26 @@ class InMemoryFilesystemAdapter(FilesystemAdapter):
         Returns:
             None
         """
+        file_ = self._node(source)
+        if not isinstance(file_, InMemoryFile):
+            raise UnableToMoveFile.with_location(source, destination, "File does not exist")
+        parent, name = self._parent(destination, create=True)
+        if parent is None or not name:
+            raise UnableToMoveFile.with_location(source, destination, "Invalid destination path")
+        # Remove the source before inserting: when both resolve to the same
+        # trie slot, popping afterwards would delete the just-moved file
+        source_parent, source_name = self._parent(source)
+        if source_parent is not None:
+            source_parent.pop(source_name, None)
+        parent[name] = file_
+
+    def temporary_url(self, path: str, options: Dict[str, Any] = None) -> str:
+        """
+        Get pre-signed url of a file
+        Arguments:
+            path: The file path
+            options: Temporary file options
+        Returns:
+            The pre-signed url of file as string
+        """
+        raise NotImplementedError
@@ -1,10 +1,20 @@
+import codecs
+import io
 import os
+import queue
+import threading
+import time
 
-from typing import IO, Any, Dict, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import IO, Any, Dict, Iterator, List, Optional
 
 import boto3
 
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
 from botocore.client import ClientError, Config
+from botocore.exceptions import BotoCoreError
 
 from ..adapters import FilesystemAdapter
 from ..error import (
@@ -20,6 +30,108 @@ from ..error import (
     UnableToRetrieveMetadata,
     UnableToWriteFile,
 )
+from ..visibility import Visibility
+
+# Streaming chunk size for GetObject bodies; ~100KB keeps per-chunk Python
+# overhead low without ballooning the working set
+_READ_CHUNK_SIZE = 100 * 1024
+
+# Bounds for the per-process ETag-validated content cache
+_CONTENT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_CONTENT_CACHE_ENTRY_MAX_BYTES = 8 * 1024 * 1024
+
+# Entry bound for the stat/ACL TTL caches; expired entries are not swept, so
+# the LRU cap keeps large listings from pinning metadata for every key
+_META_CACHE_MAX_ENTRIES = 4096
+
+# Listing budget for bulk_exists before it falls back to per-path HEADs;
+# 10 pages is up to 10,000 keys scanned under the shared prefix
+_BULK_EXISTS_MAX_PAGES = 10
+
+# Write options forwarded verbatim to PutObject/upload ExtraArgs
+_PUT_OPTION_KEYS = ("ContentType", "CacheControl", "Metadata")
+
+# Canned ACLs corresponding to each portable visibility value
+_ACL_BY_VISIBILITY = {
+    Visibility.PUBLIC.value: "public-read",
+    Visibility.PRIVATE.value: "private",
+}
+
+
+class _PrefetchStream:
+    """
+    File-like wrapper that keeps a bounded number of chunks in flight.
+
+    A background thread drains the body into a small queue so the network
+    fills while the consumer processes the previous chunk.
+    """
+
+    _SENTINEL = object()
+
+    def __init__(self, body: IO, chunk_size: int = 256 * 1024, prefetch: int = 2) -> None:
+        self._body = body
+        self._queue: queue.Queue = queue.Queue(maxsize=prefetch)
+        self._buffer = bytearray()
+        self._eof = False
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._fill, args=(chunk_size,), daemon=True)
+        self._thread.start()
+
+    def _fill(self, chunk_size: int):
+        try:
+            for chunk in self._body.iter_chunks(chunk_size):
+                if not self._put(chunk):
+                    return
+        except Exception as ex:  # noqa: BLE001 - re-raised in the consumer thread
+            self._put(ex)
+        else:
+            self._put(self._SENTINEL)
+
+    def _put(self, item) -> bool:
+        # Bounded put that gives up once the consumer has closed the stream,
+        # so an abandoned producer never blocks forever on a full queue
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._eof and (size is None or size < 0 or len(self._buffer) < size):
+            item = self._queue.get()
+            if item is self._SENTINEL:
+                self._eof = True
+            elif isinstance(item, Exception):
+                self._eof = True
+                raise item
+            else:
+                self._buffer.extend(item)
+        if size is None or size < 0:
+            data = bytes(self._buffer)
+            self._buffer.clear()
+            return data
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def close(self):
+        self._stopped.set()
+        self._body.close()
+        # Unblock a producer waiting on a full queue, then let it finish
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._thread.join(timeout=1.0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
 
 class S3FilesystemAdapter(FilesystemAdapter):
@@ -27,18 +139,105 @@ class S3FilesystemAdapter(FilesystemAdapter):
     Local filesystem adapter class
     """
 
+    # Clients (and their pooled TLS connections) shared across adapter
+    # instances that target the same endpoint and credentials
+    _client_cache: Dict[tuple, Any] = {}
+    _client_cache_lock = threading.Lock()
+
     def __init__(
         self, endpoint_url: str, access_key_id: str, secret_access_key: str, bucket_name: str, region_name: str
     ) -> None:
-        session = boto3.Session(aws_access_key_id=access_key_id, aws_secret_access_key=secret_access_key)
-        self._s3 = session.resource(
-            "s3", endpoint_url=endpoint_url, region_name=region_name, config=Config(signature_version="s3v4")
-        )
-        self._client = session.client(
-            "s3", endpoint_url=endpoint_url, region_name=region_name, config=Config(signature_version="s3v4")
-        )
+        cache_key = (endpoint_url, access_key_id, secret_access_key, region_name)
+        with self._client_cache_lock:
+            cached = self._client_cache.get(cache_key)
+            fresh = cached is None
+            if fresh:
+                session = boto3.Session(aws_access_key_id=access_key_id, aws_secret_access_key=secret_access_key)
+                # A pool sized for the thread-pooled delete/copy/upload paths;
+                # the default of 10 sockets stalls them with
+                # discarded-connection churn
+                config = Config(
+                    signature_version="s3v4",
+                    max_pool_connections=64,
+                    retries={"max_attempts": 10, "mode": "adaptive"},
+                    tcp_keepalive=True,
+                    read_timeout=60,
+                    connect_timeout=5,
+                )
+                cached = (
+                    session.resource("s3", endpoint_url=endpoint_url, region_name=region_name, config=config),
+                    session.client("s3", endpoint_url=endpoint_url, region_name=region_name, config=config),
+                )
+                self._client_cache[cache_key] = cached
+        self._s3, self._client = cached
+        if fresh:
+            # One cheap HEAD primes DNS, TLS, and auth into the fresh pool so
+            # the first real operation pulls a warm socket
+            try:
+                self._client.head_bucket(Bucket=bucket_name)
+            except (ClientError, BotoCoreError):
+                pass
         self._bucket_name = bucket_name
         self._bucket = self._s3.Bucket(bucket_name)
+        # Bind the hot client entry points once; get_paginator re-parses the
+        # service model and bound methods skip per-call attribute resolution
+        self._list_paginator = self._client.get_paginator("list_objects_v2")
+        self._list_objects_v2 = self._client.list_objects_v2
+        self._delete_objects = self._client.delete_objects
+        self._head_object = self._client.head_object
+        self._get_object = self._client.get_object
+        self._put_object = self._client.put_object
+        self._copy_object = self._client.copy_object
+        self._stat_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._acl_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._stat_ttl = 5.0
+        self._content_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._content_cache_bytes = 0
+        # Uploads above the threshold split into parallel multipart PUTs
+        self._transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=10,
+            use_threads=True,
+        )
+        # Server-side copies above the threshold run as parallel UploadPartCopy requests
+        self._copy_config = TransferConfig(
+            multipart_threshold=64 * 1024 * 1024,
+            multipart_chunksize=64 * 1024 * 1024,
+            max_concurrency=16,
+            use_threads=True,
+        )
+
+    @staticmethod
+    def _cache_put(cache: "OrderedDict[str, Any]", key: str, value: Any):
+        """
+        Insert into a TTL cache, evicting least-recently-used entries.
+        Arguments:
+            cache: The OrderedDict-backed cache
+            key: The cache key
+            value: The value to store
+        Returns:
+            None
+        """
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > _META_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+
+    def _try_head(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        HeadObject that reports missing keys as None instead of raising.
+        Arguments:
+            path: The file path
+        Returns:
+            The HeadObject response dict, or None when the key does not exist
+        """
+        try:
+            return self._head_object(Bucket=self._bucket_name, Key=path)
+        except ClientError as ex:
+            if ex.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
 
     def file_exists(self, path: str) -> bool:
         """
@@ -49,12 +248,9 @@ class S3FilesystemAdapter(FilesystemAdapter):
             True if the file existed
         """
         try:
-            self._bucket.Object(path).load()
+            return self._try_head(path) is not None
         except ClientError as ex:
-            if ex.response["Error"]["Code"] == "404":
-                return False
             raise UnableToCheckExistence.with_location(path, str(ex))
-        return True
 
     def directory_exists(self, path: str) -> bool:
         """
@@ -65,15 +261,58 @@ class S3FilesystemAdapter(FilesystemAdapter):
             True if the directory existed
         """
         try:
-            paginator = self._client.get_paginator("list_objects_v2")
-            page_iterator = paginator.paginate(Bucket=self._bucket_name, Prefix=path)
-            for page in page_iterator:
-                if "Contents" in page:
-                    return True
-            return False
+            response = self._list_objects_v2(Bucket=self._bucket_name, Prefix=path, MaxKeys=1)
+            return response.get("KeyCount", 0) > 0
         except ClientError as ex:
             raise UnableToCheckDirectoryExistence.with_location(path, str(ex))
 
+    def bulk_exists(self, paths: List[str]) -> Dict[str, bool]:
+        """
+        Determine existence for many files with one listing.
+        Arguments:
+            paths: The file paths
+        Returns:
+            Mapping of path to existence
+        """
+        if not paths:
+            return {}
+        # One paginated LIST under the longest shared prefix replaces a
+        # HeadObject round trip per path; paths that share no prefix would
+        # turn that into a whole-bucket scan, so they HEAD individually
+        prefix = os.path.commonprefix(paths)
+        if not prefix:
+            return self._bulk_exists_head(paths)
+        keys = set()
+        pages = 0
+        try:
+            for page in self._list_paginator.paginate(Bucket=self._bucket_name, Prefix=prefix):
+                pages += 1
+                if pages > _BULK_EXISTS_MAX_PAGES:
+                    # The shared prefix is too unselective for a LIST to pay
+                    # off; bounded per-path HEADs beat paging the bucket
+                    return self._bulk_exists_head(paths)
+                for entry in page.get("Contents", ()):
+                    keys.add(entry["Key"])
+        except ClientError as ex:
+            raise UnableToCheckExistence.with_location(prefix, str(ex))
+        return {path: path in keys for path in paths}
+
+    def _bulk_exists_head(self, paths: List[str]) -> Dict[str, bool]:
+        """
+        Determine existence with one HeadObject per path.
+        Arguments:
+            paths: The file paths
+        Returns:
+            Mapping of path to existence
+        """
+        result = {}
+        for path in paths:
+            try:
+                result[path] = self._try_head(path) is not None
+            except ClientError as ex:
+                raise UnableToCheckExistence.with_location(path, str(ex))
+        return result
+
     def write(self, path: str, contents: str, options: Dict[str, Any] = None):
         """
         Write the contents of a file.
@@ -84,11 +323,37 @@ class S3FilesystemAdapter(FilesystemAdapter):
         Returns:
             None
         """
+        data = contents.encode() if isinstance(contents, str) else contents
+        extra = {key: options[key] for key in _PUT_OPTION_KEYS if key in options} if options else {}
         try:
-            self._bucket.Object(path).put(Body=contents)
-        except ClientError as ex:
+            if len(data) < self._transfer_config.multipart_threshold:
+                # Below the multipart threshold a single PutObject is one
+                # request with no transfer-manager machinery
+                self._put_object(Bucket=self._bucket_name, Key=path, Body=data, **extra)
+            else:
+                self._client.upload_fileobj(
+                    io.BytesIO(data), self._bucket_name, path, Config=self._transfer_config, ExtraArgs=extra or None
+                )
+            self._stat_cache.pop(path, None)
+        except (ClientError, S3UploadFailedError) as ex:
             raise UnableToWriteFile.with_location(path, str(ex))
 
+    def write_many(self, items: Dict[str, Any], options: Dict[str, Any] = None):
+        """
+        Write many files concurrently
+        Arguments:
+            items: Mapping of file path to contents
+            options: Write options applied to every file
+        Returns:
+            None
+        """
+        futures = []
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for path, contents in items.items():
+                futures.append(executor.submit(self.write, path, contents, options))
+            for future in as_completed(futures):
+                future.result()
+
     def write_stream(self, path: str, resource: IO, options: Dict[str, Any] = None):
         """
         Write the contents of a file from stream
@@ -99,9 +364,25 @@ class S3FilesystemAdapter(FilesystemAdapter):
         Returns:
             None
         """
+        config = self._transfer_config
+        if options is not None:
+            config = options.get("transfer_config", config)
+        remaining = resource.getbuffer().nbytes - resource.tell() if isinstance(resource, io.BytesIO) else None
+        if remaining is not None and remaining < config.multipart_threshold:
+            # Small in-memory buffers skip the transfer manager and go out as
+            # one PutObject, judged against the per-call threshold rather
+            # than the adapter default
+            extra = {key: options[key] for key in _PUT_OPTION_KEYS if key in options} if options else {}
+            try:
+                self._put_object(Bucket=self._bucket_name, Key=path, Body=resource.read(), **extra)
+                self._stat_cache.pop(path, None)
+            except ClientError as ex:
+                raise UnableToWriteFile.with_location(path, str(ex))
+            return
         try:
-            self._client.upload_fileobj(resource, self._bucket_name, path)
-        except ClientError as ex:
+            self._client.upload_fileobj(resource, self._bucket_name, path, Config=config)
+            self._stat_cache.pop(path, None)
+        except (ClientError, S3UploadFailedError) as ex:
             raise UnableToWriteFile.with_location(path, str(ex))
         except TypeError as ex:
             raise UnableToWriteFile.with_location(path, str(ex))
@@ -115,11 +396,13 @@ class S3FilesystemAdapter(FilesystemAdapter):
             The contents of file as string
         """
         try:
-            file_obj = self._bucket.Object(path)
-            file_content = file_obj.get()["Body"].read().decode("utf-8")
+            body = self._get_object(Bucket=self._bucket_name, Key=path)["Body"]
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            parts = [decoder.decode(chunk) for chunk in body.iter_chunks(_READ_CHUNK_SIZE)]
+            parts.append(decoder.decode(b"", True))
         except ClientError as ex:
             raise UnableToReadFile.with_location(path, str(ex))
-        return file_content
+        return "".join(parts)
 
     def read_bytes(self, path: str) -> bytes:
         """
@@ -129,27 +412,60 @@ class S3FilesystemAdapter(FilesystemAdapter):
         Returns:
             The contents of file as string
         """
+        cached = self._content_cache.get(path)
+        kwargs = {"Bucket": self._bucket_name, "Key": path}
+        if cached is not None:
+            # Conditional GET: an unchanged object answers with a bodiless 304
+            kwargs["IfNoneMatch"] = cached[0]
         try:
-            file_obj = self._bucket.Object(path)
-            file_content = file_obj.get()["Body"].read()
+            response = self._get_object(**kwargs)
+            buffer = bytearray()
+            for chunk in response["Body"].iter_chunks(_READ_CHUNK_SIZE):
+                buffer.extend(chunk)
         except ClientError as ex:
+            if cached is not None and ex.response.get("Error", {}).get("Code") in ("304", "NotModified"):
+                self._content_cache.move_to_end(path)
+                return cached[1]
             raise UnableToReadFile.with_location(path, str(ex))
-        return bytes(file_content)
+        data = bytes(buffer)
+        self._cache_content(path, response.get("ETag"), data)
+        return data
 
-    def read_stream(self, path: str) -> IO:
+    def _cache_content(self, path: str, etag: str, data: bytes):
+        """
+        Store read contents in the LRU content cache, evicting as needed.
+        Arguments:
+            path: The file path
+            etag: The object's ETag
+            data: The object contents
+        Returns:
+            None
+        """
+        old = self._content_cache.pop(path, None)
+        if old is not None:
+            self._content_cache_bytes -= len(old[1])
+        if etag is None or len(data) > _CONTENT_CACHE_ENTRY_MAX_BYTES:
+            return
+        self._content_cache[path] = (etag, data)
+        self._content_cache_bytes += len(data)
+        while self._content_cache_bytes > _CONTENT_CACHE_MAX_BYTES:
+            _, evicted = self._content_cache.popitem(last=False)
+            self._content_cache_bytes -= len(evicted[1])
+
+    def read_stream(self, path: str, prefetch: int = 2) -> IO:
         """
         Read the contents of a file as stream
         Arguments:
             path: The file path
+            prefetch: Number of chunks to keep in flight ahead of the consumer
         Returns:
             The contents of file as stream
         """
         try:
-            file_obj = self._bucket.Object(path)
-            stream = file_obj.get()["Body"]
+            stream = self._get_object(Bucket=self._bucket_name, Key=path)["Body"]
         except ClientError as ex:
             raise UnableToReadFile.with_location(path, str(ex))
-        return stream
+        return _PrefetchStream(stream, prefetch=prefetch)
 
     def delete(self, path: str):
         """
@@ -163,6 +479,7 @@ class S3FilesystemAdapter(FilesystemAdapter):
             raise UnableToDeleteFile.with_location(path, "Could not delete directory")
         try:
             self._bucket.Object(path).delete()
+            self._stat_cache.pop(path, None)
         except ClientError as ex:
             raise UnableToDeleteFile.with_location(path, str(ex))
 
@@ -174,25 +491,62 @@ class S3FilesystemAdapter(FilesystemAdapter):
         Returns:
             True if the directory is deleted successfully
         """
+        futures = []
         try:
-            # List all objects with the directory prefix
-            objects_to_delete = []
-            paginator = self._client.get_paginator("list_objects_v2")
-            page_iterator = paginator.paginate(Bucket=self._bucket_name, Prefix=path)
-            for page in page_iterator:
-                objects_to_delete.extend(page.get("Contents", []))
-
-            # Delete the objects in batches of 1000 (S3 limit)
-            while objects_to_delete:
-                objects_batch = objects_to_delete[:1000]
-                self._client.delete_objects(
-                    Bucket=self._bucket_name, Delete={"Objects": [{"Key": obj_key["Key"]} for obj_key in objects_batch]}
-                )
-                objects_to_delete = objects_to_delete[1000:]
+            page_iterator = self._list_paginator.paginate(Bucket=self._bucket_name, Prefix=path)
+            # Each page holds at most 1000 keys, the delete_objects batch limit;
+            # deleting pages concurrently overlaps the network round-trips
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                for page in page_iterator:
+                    contents = page.get("Contents")
+                    if not contents:
+                        continue
+                    batch = [{"Key": obj_key["Key"]} for obj_key in contents]
+                    futures.append(
+                        executor.submit(
+                            self._delete_objects,
+                            Bucket=self._bucket_name,
+                            Delete={"Objects": batch, "Quiet": True},
+                        )
+                    )
+                for future in as_completed(futures):
+                    future.result()
         except ClientError as ex:
+            for future in futures:
+                future.cancel()
             raise UnableToDeleteDirectory.with_location(path, str(ex))
         return True
 
+    def delete_many(self, paths: List[str]):
+        """
+        Delete many files in bounded-concurrency batches
+        Arguments:
+            paths: The file paths
+        Returns:
+            None
+        """
+        futures = []
+        try:
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                for start in range(0, len(paths), 1000):
+                    end = start + 1000
+                    batch = [{"Key": key} for key in paths[start:end]]
+                    futures.append(
+                        executor.submit(
+                            self._delete_objects,
+                            Bucket=self._bucket_name,
+                            Delete={"Objects": batch, "Quiet": True},
+                        )
+                    )
+                for future in as_completed(futures):
+                    future.result()
+        except ClientError as ex:
+            for future in futures:
+                future.cancel()
+            raise UnableToDeleteFile.with_location(paths[0] if paths else "", str(ex))
+        for key in paths:
+            self._stat_cache.pop(key, None)
+
     def create_directory(self, path: str, options: Dict[str, Any] = None):
         """
         Create a directory.
@@ -217,11 +571,12 @@ class S3FilesystemAdapter(FilesystemAdapter):
         Returns:
             None
         """
-        # try:
-        #     self._bucket.Object(path).Acl().put(ACL=self.visibility_converter.for_file(visibility))
-        # except ClientError:
-        #     pass
-        raise NotImplementedError
+        Visibility.validate(visibility)
+        try:
+            self._client.put_object_acl(Bucket=self._bucket_name, Key=path, ACL=_ACL_BY_VISIBILITY[visibility])
+            self._acl_cache.pop(path, None)
+        except ClientError as ex:
+            raise UnableToRetrieveMetadata.with_location(path, str(ex))
 
     def visibility(self, path: str) -> str:
         """
@@ -231,12 +586,44 @@ class S3FilesystemAdapter(FilesystemAdapter):
         Returns:
             The file's visibility
         """
-        # object_acl = self._client.get_object_acl(Bucket=self._bucket_name, Key=path)
-        # grant = object_acl.get("Grants")[0]
-        # visibility = grant.get("Permission")
-        #
-        # return self.visibility_converter.inverse_for_file(visibility)
-        raise NotImplementedError
+        now = time.monotonic()
+        cached = self._acl_cache.get(path)
+        if cached is not None and now - cached[0] < self._stat_ttl:
+            self._acl_cache.move_to_end(path)
+            return cached[1]
+        try:
+            object_acl = self._client.get_object_acl(Bucket=self._bucket_name, Key=path)
+        except ClientError as ex:
+            raise UnableToRetrieveMetadata.with_location(path, str(ex))
+        # A single scan for an AllUsers grant decides public vs private
+        grant = next(
+            (
+                grant
+                for grant in object_acl.get("Grants", [])
+                if grant.get("Grantee", {}).get("URI", "").endswith("AllUsers")
+            ),
+            None,
+        )
+        visibility = Visibility.PUBLIC.value if grant is not None else Visibility.PRIVATE.value
+        self._cache_put(self._acl_cache, path, (now, visibility))
+        return visibility
+
+    def _stat(self, path: str) -> Dict[str, Any]:
+        """
+        Get the HeadObject response for a path, memoized for a short TTL.
+        Arguments:
+            path: The file path
+        Returns:
+            The HeadObject response dict
+        """
+        now = time.monotonic()
+        cached = self._stat_cache.get(path)
+        if cached is not None and now - cached[0] < self._stat_ttl:
+            self._stat_cache.move_to_end(path)
+            return cached[1]
+        head = self._head_object(Bucket=self._bucket_name, Key=path)
+        self._cache_put(self._stat_cache, path, (now, head))
+        return head
 
     def file_size(self, path: str) -> int:
         """
@@ -247,11 +634,9 @@ class S3FilesystemAdapter(FilesystemAdapter):
             The file size in bytes
         """
         try:
-            obj = self._bucket.Object(path)
-            file_size = obj.content_length
+            return self._stat(path)["ContentLength"]
         except ClientError as ex:
             raise UnableToRetrieveMetadata.with_location(path, str(ex))
-        return file_size
 
     def mime_type(self, path: str) -> str:
         """
@@ -262,11 +647,15 @@ class S3FilesystemAdapter(FilesystemAdapter):
             The file's mimetype
         """
         try:
-            obj = self._bucket.Object(path)
-            mime_type = obj.content_type
+            head = self._stat(path)
+            if "ContentType" not in head:
+                # Entries seeded from listings carry no ContentType; refresh
+                # with a full HeadObject for this one field
+                self._stat_cache.pop(path, None)
+                head = self._stat(path)
+            return head["ContentType"]
         except ClientError as ex:
             raise UnableToRetrieveMetadata.with_location(path, str(ex))
-        return mime_type
 
     def last_modified(self, path: str) -> int:
         """
@@ -277,33 +666,87 @@ class S3FilesystemAdapter(FilesystemAdapter):
             The file's last modified time as timestamp
         """
         try:
-            obj = self._bucket.Object(path)
-            last_modified_timestamp = obj.last_modified
+            return int(self._stat(path)["LastModified"].timestamp() * 1000)
         except ClientError as ex:
             raise UnableToRetrieveMetadata.with_location(path, str(ex))
-        return int(last_modified_timestamp.timestamp() * 1000)
 
-    def list_contents(self, path: str) -> List[str]:
+    def list_contents(self, path: str, recursive: bool = True) -> List[str]:
         """
         Get all (recursive) of the directories within a given directory.
         Arguments:
             path: Directory path
+            recursive: List the whole subtree or only the immediate children
         Returns:
             List all directories in the given directory
         """
-        file_keys = []
         try:
-            paginator = self._client.get_paginator("list_objects_v2")
-            page_iterator = paginator.paginate(Bucket=self._bucket_name, Prefix=path)
-
-            # Collect all file keys (names) within the directory
-            for page in page_iterator:
-                if "Contents" in page:
-                    for obj in page["Contents"]:
-                        file_keys.append(obj["Key"])
+            return [key for key in self.iter_contents(path, recursive)]
         except ClientError:
             return []
-        return file_keys
+
+    def iter_contents(self, path: str, recursive: bool = True) -> Iterator[str]:
+        """
+        Lazily yield all object keys within a given directory.
+        Arguments:
+            path: Directory path
+            recursive: Yield the whole subtree or only the immediate children
+        Returns:
+            Iterator over the object keys (and, non-recursively, the child prefixes)
+        """
+        if recursive:
+            page_iterator = self._list_paginator.paginate(
+                Bucket=self._bucket_name, Prefix=path, PaginationConfig={"PageSize": 1000}
+            )
+            now = time.monotonic()
+            for entry in page_iterator.search("Contents[]"):
+                if entry is None:
+                    continue
+                # LIST already carries size and mtime per key; seeding the
+                # stat cache makes follow-up metadata calls free (ContentType
+                # is absent, so mime_type falls back to a real HEAD)
+                self._cache_put(
+                    self._stat_cache,
+                    entry["Key"],
+                    (now, {"ContentLength": entry["Size"], "LastModified": entry["LastModified"]}),
+                )
+                yield entry["Key"]
+            return
+        # Delimiter rolls each subtree up into one CommonPrefixes entry, so
+        # the listing is O(children) instead of O(subtree)
+        prefix = path if not path or path.endswith("/") else path + "/"
+        page_iterator = self._list_paginator.paginate(
+            Bucket=self._bucket_name, Prefix=prefix, Delimiter="/", PaginationConfig={"PageSize": 1000}
+        )
+        for entry in page_iterator.search("[CommonPrefixes[].Prefix, Contents[].Key][]"):
+            if entry is not None:
+                yield entry
+
+    def _server_side_copy(self, source: str, destination: str):
+        """
+        Copy an object within the bucket without downloading it.
+        Arguments:
+            source: Source object key
+            destination: Destination object key
+        Returns:
+            None
+        """
+        cached = self._stat_cache.get(source)
+        if cached is not None and cached[1]["ContentLength"] < self._copy_config.multipart_threshold:
+            # Known-small objects take one CopyObject request and skip the
+            # transfer manager's thread machinery entirely
+            self._copy_object(
+                CopySource={"Bucket": self._bucket_name, "Key": source},
+                Bucket=self._bucket_name,
+                Key=destination,
+            )
+        else:
+            self._client.copy(
+                CopySource={"Bucket": self._bucket_name, "Key": source},
+                Bucket=self._bucket_name,
+                Key=destination,
+                Config=self._copy_config,
+            )
+        self._stat_cache.pop(destination, None)
 
     def copy(self, source: str, destination: str, options: Dict[str, Any] = None):
         """
@@ -318,9 +761,11 @@ class S3FilesystemAdapter(FilesystemAdapter):
         if source.endswith("/"):
             raise UnableToCopyFile.with_location(source, destination, "Could not copy directory to file")
         if destination.endswith("/"):
-            destination = os.path.join(destination, os.path.basename(source))
+            # Keys always use "/": plain concatenation avoids os.path's
+            # platform-specific separator handling
+            destination = destination + source.rpartition("/")[2]
         try:
-            self._bucket.Object(destination).copy_from(CopySource={"Bucket": self._bucket_name, "Key": source})
+            self._server_side_copy(source, destination)
         except ClientError as ex:
             raise UnableToCopyFile.with_location(source, destination, str(ex))
 
@@ -337,10 +782,13 @@ class S3FilesystemAdapter(FilesystemAdapter):
         if source.endswith("/"):
             raise UnableToMoveFile.with_location(source, destination, "Could not move directory to file")
         if destination.endswith("/"):
-            destination = os.path.join(destination, os.path.basename(source))
+            # Keys always use "/": plain concatenation avoids os.path's
+            # platform-specific separator handling
+            destination = destination + source.rpartition("/")[2]
         try:
-            self._bucket.Object(destination).copy_from(CopySource={"Bucket": self._bucket_name, "Key": source})
-            self._bucket.Object(source).delete()
+            self._server_side_copy(source, destination)
+            self._client.delete_object(Bucket=self._bucket_name, Key=source)
+            self._stat_cache.pop(source, None)
         except ClientError as ex:
             raise UnableToMoveFile.with_location(source, destination, str(ex))
 
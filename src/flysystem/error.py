@@ -60,11 +60,13 @@ class UnableToOperateToFile(FlyFilesystemException):
     Unable to operate to file exception
     """
 
-    def __init__(self, *args: object) -> None:
-        super().__init__(*args)
-        self._operation = ""
-        self._location = ""
-        self._reason = ""
+    __slots__ = ("_operation", "_location", "_reason")
+
+    def __init__(self, message: str = "", operation: str = "", location: str = "", reason: str = "") -> None:
+        super().__init__(message)
+        self._operation = operation
+        self._location = location
+        self._reason = reason
 
     @final
     def operation(self) -> str:
@@ -83,129 +85,107 @@ class UnableToOperateToFile(FlyFilesystemException):
 class UnableToCheckExistence(UnableToOperateToFile):
     @classmethod
     def with_location(cls, location: str, reason: str = "") -> Self:
-        msg = f"Unable to check existence file from location: {location}. {reason}".rstrip()
-        this = cls(msg)
-        this._operation = FilesystemOperationFailed.OPERATION_FILE_EXISTS.value
-        this._location = location
-        this._reason = reason
-        return this
+        msg = f"Unable to check existence file from location: {location}."
+        if reason:
+            msg = f"{msg} {reason}"
+        return cls(msg, FilesystemOperationFailed.OPERATION_FILE_EXISTS.value, location, reason)
 
 
 @final
 class UnableToCopyFile(UnableToOperateToFile):
     @classmethod
     def with_location(cls, source: str, destination: str, reason: str = "") -> Self:
-        msg = f"Unable to copy file from location: {source} to {destination}. {reason}".rstrip()
-        this = cls(msg)
-        this._operation = FilesystemOperationFailed.OPERATION_COPY.value
-        this._location = source
-        this._reason = reason
-        return this
+        msg = f"Unable to copy file from location: {source} to {destination}."
+        if reason:
+            msg = f"{msg} {reason}"
+        return cls(msg, FilesystemOperationFailed.OPERATION_COPY.value, source, reason)
 
 
 @final
 class UnableToCheckDirectoryExistence(UnableToOperateToFile):
     @classmethod
     def with_location(cls, location: str, reason: str = "") -> Self:
-        msg = f"Unable to check existence directory from location: {location}. {reason}".rstrip()
-        this = cls(msg)
-        this._operation = FilesystemOperationFailed.OPERATION_DIRECTORY_EXISTS.value
-        this._location = location
-        this._reason = reason
-        return this
+        msg = f"Unable to check existence directory from location: {location}."
+        if reason:
+            msg = f"{msg} {reason}"
+        return cls(msg, FilesystemOperationFailed.OPERATION_DIRECTORY_EXISTS.value, location, reason)
 
 
 @final
 class UnableToCreateDirectory(UnableToOperateToFile):
     @classmethod
     def with_location(cls, location: str, reason: str = "") -> Self:
-        msg = f"Unable to create directory from location: {location}. {reason}".rstrip()
-        this = cls(msg)
-        this._operation = FilesystemOperationFailed.OPERATION_CREATE_DIRECTORY.value
-        this._location = location
-        this._reason = reason
-        return this
+        msg = f"Unable to create directory from location: {location}."
+        if reason:
+            msg = f"{msg} {reason}"
+        return cls(msg, FilesystemOperationFailed.OPERATION_CREATE_DIRECTORY.value, location, reason)
 
 
 @final
 class UnableToDeleteDirectory(UnableToOperateToFile):
     @classmethod
     def with_location(cls, location: str, reason: str = "") -> Self:
-        msg = f"Unable to delete directory from location: {location}. {reason}".rstrip()
-        this = cls(msg)
-        this._operation = FilesystemOperationFailed.OPERATION_DELETE_DIRECTORY.value
-        this._location = location
-        this._reason = reason
-        return this
+        msg = f"Unable to delete directory from location: {location}."
+        if reason:
+            msg = f"{msg} {reason}"
+        return cls(msg, FilesystemOperationFailed.OPERATION_DELETE_DIRECTORY.value, location, reason)
 
 
 @final
 class UnableToDeleteFile(UnableToOperateToFile):
     @classmethod
     def with_location(cls, location: str, reason: str = "") -> Self:
-        msg = f"Unable to delete file from location: {location}. {reason}".rstrip()
-        this = cls(msg)
-        this._operation = FilesystemOperationFailed.OPERATION_DELETE.value
-        this._location = location
-        this._reason = reason
-        return this
+        msg = f"Unable to delete file from location: {location}."
+        if reason:
+            msg = f"{msg} {reason}"
+        return cls(msg, FilesystemOperationFailed.OPERATION_DELETE.value, location, reason)
 
 
 @final
 class UnableToMoveFile(UnableToOperateToFile):
     @classmethod
     def with_location(cls, source: str, destination: str, reason: str = "") -> Self:
-        msg = f"Unable to move file from location: {source} to {destination}. {reason}".rstrip()
-        this = cls(msg)
-        this._operation = FilesystemOperationFailed.OPERATION_MOVE.value
-        this._location = source
-        this._reason = reason
-        return this
+        msg = f"Unable to move file from location: {source} to {destination}."
+        if reason:
+            msg = f"{msg} {reason}"
+        return cls(msg, FilesystemOperationFailed.OPERATION_MOVE.value, source, reason)
 
 
 @final
 class UnableToReadFile(UnableToOperateToFile):
     @classmethod
     def with_location(cls, location: str, reason: str = "") -> Self:
-        msg = f"Unable to read file from location: {location}. {reason}".rstrip()
-        this = cls(msg)
-        this._operation = FilesystemOperationFailed.OPERATION_READ.value
-        this._location = location
-        this._reason = reason
-        return this
+        msg = f"Unable to read file from location: {location}."
+        if reason:
+            msg = f"{msg} {reason}"
+        return cls(msg, FilesystemOperationFailed.OPERATION_READ.value, location, reason)
 
 
 @final
 class UnableToRetrieveMetadata(UnableToOperateToFile):
     @classmethod
     def with_location(cls, location: str, reason: str = "") -> Self:
-        msg = f"Unable to retrieve metadata from location: {location}. {reason}".rstrip()
-        this = cls(msg)
-        this._operation = FilesystemOperationFailed.OPERATION_RETRIEVE_METADATA.value
-        this._location = location
-        this._reason = reason
-        return this
+        msg = f"Unable to retrieve metadata from location: {location}."
+        if reason:
+            msg = f"{msg} {reason}"
+        return cls(msg, FilesystemOperationFailed.OPERATION_RETRIEVE_METADATA.value, location, reason)
 
 
 @final
 class UnableToWriteFile(UnableToOperateToFile):
     @classmethod
     def with_location(cls, location: str, reason: str = "") -> Self:
-        msg = f"Unable to write file from location: {location}. {reason}".rstrip()
-        this = cls(msg)
-        this._operation = FilesystemOperationFailed.OPERATION_WRITE.value
-        this._location = location
-        this._reason = reason
-        return this
+        msg = f"Unable to write file from location: {location}."
+        if reason:
+            msg = f"{msg} {reason}"
+        return cls(msg, FilesystemOperationFailed.OPERATION_WRITE.value, location, reason)
 
 
 @final
 class UnableToGenerateTemporaryUrl(UnableToOperateToFile):
     @classmethod
     def with_location(cls, location: str, reason: str = "") -> Self:
-        msg = f"Unable to generate pre-signed url from location: {location}. {reason}".rstrip()
-        this = cls(msg)
-        this._operation = FilesystemOperationFailed.OPERATION_TEMPORARY_URL.value
-        this._location = location
-        this._reason = reason
-        return this
+        msg = f"Unable to generate pre-signed url from location: {location}."
+        if reason:
+            msg = f"{msg} {reason}"
+        return cls(msg, FilesystemOperationFailed.OPERATION_TEMPORARY_URL.value, location, reason)
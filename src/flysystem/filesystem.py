@@ -2,11 +2,14 @@
 Module flysystem
 """
 
+import time
+
 from abc import ABCMeta, abstractmethod
+from types import MappingProxyType
 from typing import IO, Any, Dict, List
 
 from .adapters import FilesystemAdapter
-from .path import PathNormalizer, WhitespacePathNormalizer
+from .path import DEFAULT_PATH_NORMALIZER, PathNormalizer
 
 
 class FilesystemReader(metaclass=ABCMeta):
@@ -15,6 +18,8 @@ class FilesystemReader(metaclass=ABCMeta):
     All methods containing are non-destructive.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def file_exists(self, path: str) -> bool:
         """
@@ -115,6 +120,36 @@ class FilesystemReader(metaclass=ABCMeta):
             List all directories in the given directory
         """
 
+    def file_exists_batch(self, paths: List[str]) -> Dict[str, bool]:
+        """
+        Determine existence for many files at once.
+        Arguments:
+            paths: The file paths
+        Returns:
+            Mapping of path to existence; implementations may batch the lookups
+        """
+        return {path: self.file_exists(path) for path in paths}
+
+    def file_size_batch(self, paths: List[str]) -> Dict[str, int]:
+        """
+        Get sizes for many files at once.
+        Arguments:
+            paths: The file paths
+        Returns:
+            Mapping of path to file size in bytes
+        """
+        return {path: self.file_size(path) for path in paths}
+
+    def last_modified_batch(self, paths: List[str]) -> Dict[str, int]:
+        """
+        Get last modified times for many files at once.
+        Arguments:
+            paths: The file paths
+        Returns:
+            Mapping of path to last modified timestamp
+        """
+        return {path: self.last_modified(path) for path in paths}
+
 
 class FilesystemWriter(metaclass=ABCMeta):
     """
@@ -122,6 +157,8 @@ class FilesystemWriter(metaclass=ABCMeta):
     All methods containing are non-destructive.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def write(self, path: str, contents: str, options: Dict[str, Any] = None):
         """
@@ -218,12 +255,40 @@ class FilesystemOperator(FilesystemReader, FilesystemWriter, metaclass=ABCMeta):
     This interface contains everything from FilesystemReader and FilesystemWriter
     """
 
+    __slots__ = ()
+
 
 class Filesystem(FilesystemOperator):
     """
     Filesystem
     """
 
+    __slots__ = (
+        "adapter",
+        "config",
+        "path_normalizer",
+        "_config_frozen",
+        "_has",
+        "_file_exists",
+        "_directory_exists",
+        "_write",
+        "_write_stream",
+        "_read",
+        "_read_stream",
+        "_delete",
+        "_visibility",
+        "_set_visibility",
+        "_file_size",
+        "_mime_type",
+        "_last_modified",
+        "_delete_directory",
+        "_create_directory",
+        "_list_contents",
+        "_copy",
+        "_move",
+        "_normalize",
+    )
+
     def __init__(
         self,
         adapter: FilesystemAdapter,
@@ -232,78 +297,206 @@ class Filesystem(FilesystemOperator):
     ):
         self.adapter = adapter
         self.config = config
-        self.path_normalizer = path_normalizer or WhitespacePathNormalizer()
+        # Read-only view: _merged hands this straight to adapters on the
+        # empty-options path, and a mutating adapter must not pollute it
+        self._config_frozen = MappingProxyType(dict(config) if config else {})
+        self.path_normalizer = path_normalizer or DEFAULT_PATH_NORMALIZER
+        # Bound adapter methods: each delegate below then costs one slot
+        # fetch and a call instead of two attribute lookups per operation
+        self._has = getattr(adapter, "has", None)
+        self._file_exists = adapter.file_exists
+        self._directory_exists = adapter.directory_exists
+        self._write = adapter.write
+        self._write_stream = adapter.write_stream
+        self._read = adapter.read
+        self._read_stream = adapter.read_stream
+        self._delete = adapter.delete
+        self._visibility = adapter.visibility
+        self._set_visibility = adapter.set_visibility
+        self._file_size = adapter.file_size
+        self._mime_type = adapter.mime_type
+        self._last_modified = adapter.last_modified
+        self._delete_directory = adapter.delete_directory
+        self._create_directory = adapter.create_directory
+        self._list_contents = adapter.list_contents
+        self._copy = adapter.copy
+        self._move = adapter.move
+        self._normalize = self.path_normalizer.normalize
+
+    def _merged(self, options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Merge per-call options over the filesystem config.
+        Arguments:
+            options: Per-call options
+        Returns:
+            The merged options dict; a read-only view of the shared config when options is empty
+        """
+        if not options:
+            return self._config_frozen
+        return {**self._config_frozen, **options}
+
+    def normalize(self, path: str) -> str:
+        """
+        Normalize a path the way every operation on this filesystem will.
+        Arguments:
+            path: The path
+        Returns:
+            Represents the normalized path as string
+        """
+        return self.path_normalizer.normalize(path)
 
     def has(self, path: str) -> bool:
-        path = self.path_normalizer.normalize(path)
-        return self.adapter.file_exists(path) or self.adapter.directory_exists(path)
+        path = self._normalize(path)
+        if self._has is not None:
+            return self._has(path)
+        return self._file_exists(path) or self._directory_exists(path)
 
     def file_exists(self, path: str) -> bool:
-        return self.adapter.file_exists(self.path_normalizer.normalize(path))
+        return self._file_exists(self._normalize(path))
 
     def write(self, path: str, contents: str, options: Dict[str, Any] = None):
-        self.adapter.write(
-            self.path_normalizer.normalize(path),
-            contents,
-            (self.config or {}) | (options or {}),
-        )
+        self._write(self._normalize(path), contents, self._merged(options))
 
     def write_stream(self, path: str, resource: IO, options: Dict[str, Any] = None):
-        self.adapter.write_stream(
-            self.path_normalizer.normalize(path),
-            resource,
-            (self.config or {}) | (options or {}),
-        )
+        self._write_stream(self._normalize(path), resource, self._merged(options))
 
     def read(self, path: str) -> str:
-        return self.adapter.read(self.path_normalizer.normalize(path))
+        return self._read(self._normalize(path))
 
     def read_stream(self, path: str):
-        return self.adapter.read_stream(self.path_normalizer.normalize(path))
+        return self._read_stream(self._normalize(path))
 
     def delete(self, path: str):
-        self.adapter.delete(self.path_normalizer.normalize(path))
+        self._delete(self._normalize(path))
 
     def visibility(self, path: str) -> str:
-        return self.adapter.visibility(self.path_normalizer.normalize(path))
+        return self._visibility(self._normalize(path))
 
     def set_visibility(self, path: str, visibility: str):
-        self.adapter.set_visibility(self.path_normalizer.normalize(path), visibility)
+        self._set_visibility(self._normalize(path), visibility)
 
     def file_size(self, path: str) -> int:
-        return self.adapter.file_size(self.path_normalizer.normalize(path))
+        return self._file_size(self._normalize(path))
 
     def mime_type(self, path: str) -> str:
-        return self.adapter.mime_type(self.path_normalizer.normalize(path))
+        return self._mime_type(self._normalize(path))
 
     def last_modified(self, path: str) -> int:
-        return self.adapter.last_modified(self.path_normalizer.normalize(path))
+        return self._last_modified(self._normalize(path))
 
     def directory_exists(self, path: str) -> bool:
-        return self.adapter.directory_exists(self.path_normalizer.normalize(path))
+        return self._directory_exists(self._normalize(path))
 
     def delete_directory(self, path: str):
-        self.adapter.delete_directory(self.path_normalizer.normalize(path))
+        self._delete_directory(self._normalize(path))
 
     def create_directory(self, path: str, options: Dict[str, Any] = None):
-        self.adapter.create_directory(self.path_normalizer.normalize(path), (self.config or {}) | (options or {}))
+        self._create_directory(self._normalize(path), self._merged(options))
 
     def list_contents(self, path: str) -> List[str]:
-        return self.adapter.list_contents(self.path_normalizer.normalize(path))
+        return self._list_contents(self._normalize(path))
 
     def copy(self, source: str, destination: str, options: Dict[str, Any] = None):
-        self.adapter.copy(
-            self.path_normalizer.normalize(source),
-            self.path_normalizer.normalize(destination),
-            (self.config or {}) | (options or {}),
-        )
+        self._copy(self._normalize(source), self._normalize(destination), self._merged(options))
 
     def move(self, source: str, destination: str, options: Dict[str, Any] = None):
-        self.adapter.move(
-            self.path_normalizer.normalize(source),
-            self.path_normalizer.normalize(destination),
-            (self.config or {}) | (options or {}),
-        )
+        self._move(self._normalize(source), self._normalize(destination), self._merged(options))
 
     def temporary_url(self, path: str, options: Dict[str, Any] = None):
         return self.adapter.temporary_url(path, options)
+
+
+class StatCachingFilesystem(Filesystem):
+    """
+    Filesystem caching existence and metadata lookups for a short TTL.
+
+    Chained calls such as has + read or repeated file_exists checks on the
+    same path hit the cache instead of re-stating through the adapter.
+    Mutating operations invalidate the affected paths. list_contents is
+    never cached.
+    """
+
+    __slots__ = ("_cache", "_cache_ttl")
+
+    def __init__(
+        self,
+        adapter: FilesystemAdapter,
+        config: Dict[str, Any] = None,
+        path_normalizer: PathNormalizer = None,
+        cache_ttl: float = 1.0,
+    ):
+        super().__init__(adapter, config, path_normalizer)
+        self._cache: Dict[str, Any] = {}
+        self._cache_ttl = cache_ttl
+
+    def _cached(self, key: str, loader):
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and now - entry[0] < self._cache_ttl:
+            return entry[1]
+        value = loader()
+        self._cache[key] = (now, value)
+        return value
+
+    def invalidate(self, *paths: str):
+        """
+        Drop cached entries for the given normalized paths, or all entries.
+        Arguments:
+            paths: The paths to invalidate; clears everything when empty
+        Returns:
+            None
+        """
+        if not paths:
+            self._cache.clear()
+            return
+        for path in paths:
+            for kind in ("f:", "d:", "s:", "m:"):
+                self._cache.pop(kind + path, None)
+
+    def file_exists(self, path: str) -> bool:
+        path = self.path_normalizer.normalize(path)
+        return self._cached("f:" + path, lambda: self.adapter.file_exists(path))
+
+    def directory_exists(self, path: str) -> bool:
+        path = self.path_normalizer.normalize(path)
+        return self._cached("d:" + path, lambda: self.adapter.directory_exists(path))
+
+    def has(self, path: str) -> bool:
+        return self.file_exists(path) or self.directory_exists(path)
+
+    def file_size(self, path: str) -> int:
+        path = self.path_normalizer.normalize(path)
+        return self._cached("s:" + path, lambda: self.adapter.file_size(path))
+
+    def last_modified(self, path: str) -> int:
+        path = self.path_normalizer.normalize(path)
+        return self._cached("m:" + path, lambda: self.adapter.last_modified(path))
+
+    def write(self, path: str, contents: str, options: Dict[str, Any] = None):
+        super().write(path, contents, options)
+        self.invalidate(self.path_normalizer.normalize(path))
+
+    def write_stream(self, path: str, resource: IO, options: Dict[str, Any] = None):
+        super().write_stream(path, resource, options)
+        self.invalidate(self.path_normalizer.normalize(path))
+
+    def delete(self, path: str):
+        super().delete(path)
+        self.invalidate(self.path_normalizer.normalize(path))
+
+    def delete_directory(self, path: str):
+        super().delete_directory(path)
+        # Everything under the prefix is gone; a full clear is the safe call
+        self.invalidate()
+
+    def create_directory(self, path: str, options: Dict[str, Any] = None):
+        super().create_directory(path, options)
+        self.invalidate(self.path_normalizer.normalize(path))
+
+    def copy(self, source: str, destination: str, options: Dict[str, Any] = None):
+        super().copy(source, destination, options)
+        self.invalidate(self.path_normalizer.normalize(destination))
+
+    def move(self, source: str, destination: str, options: Dict[str, Any] = None):
+        super().move(source, destination, options)
+        self.invalidate(self.path_normalizer.normalize(source), self.path_normalizer.normalize(destination))
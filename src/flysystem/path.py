@@ -2,8 +2,61 @@
 Module flysystem
 """
 
+import sys
+
 from abc import ABCMeta, abstractmethod
-from os.path import normpath
+from functools import lru_cache
+from typing import List
+
+# Translation table mapping Windows directory separators onto "/"
+_BS_TABLE = str.maketrans("\\", "/")
+
+
+def _collapse(path: str) -> str:
+    """
+    Collapse empty, "." and ".." components in a single pass.
+    Arguments:
+        path: The path, with "/" separators
+    Returns:
+        Represents the collapsed path as string
+    """
+    absolute = path.startswith("/")
+    stack = []
+    for component in path.split("/"):
+        if not component or component == ".":
+            continue
+        if component == "..":
+            if stack and stack[-1] != "..":
+                stack.pop()
+            elif not absolute:
+                stack.append("..")
+        else:
+            stack.append(component)
+    collapsed = "/".join(stack)
+    if absolute and collapsed:
+        collapsed = "/" + collapsed
+    # Hand back the original object when nothing collapsed so callers and
+    # the intern step reuse it instead of an equal copy
+    return path if collapsed == path else collapsed
+
+
+@lru_cache(maxsize=4096)
+def _normalize_impl(path: str) -> str:
+    """
+    Normalize a path, memoized across normalizer instances.
+    Arguments:
+        path: The path
+    Returns:
+        Represents the normalized path as string
+    """
+    if "\\" in path:
+        path = path.translate(_BS_TABLE)
+    result = _collapse(path)
+    # Interned results make downstream dict keys and equality checks pointer
+    # comparisons; unbounded inputs are left alone
+    if len(result) < 1024:
+        result = sys.intern(result)
+    return result
 
 
 class PathNormalizer(metaclass=ABCMeta):
@@ -11,6 +64,8 @@ class PathNormalizer(metaclass=ABCMeta):
     Path normalizer interface
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def normalize(self, path: str) -> str:
         """
@@ -21,12 +76,46 @@ class PathNormalizer(metaclass=ABCMeta):
             Represents the normalized path as string
         """
 
+    def normalize_many(self, paths: List[str]) -> List[str]:
+        """
+        Normalize many paths at once
+        Arguments:
+            paths: The paths
+        Returns:
+            The normalized paths, in input order
+        """
+        normalize = self.normalize
+        return [normalize(path) for path in paths]
+
+
+class NullPathNormalizer(PathNormalizer):
+    """
+    No-op path normalizer for callers that guarantee canonical input.
+
+    Only safe when every path handed to the Filesystem is already
+    normalized; nothing is validated or rewritten.
+    """
+
+    __slots__ = ()
+
+    def normalize(self, path: str) -> str:
+        """
+        Return the path unchanged
+        Arguments:
+            path: The path
+        Returns:
+            The path as given
+        """
+        return path
+
 
 class WhitespacePathNormalizer(PathNormalizer):
     """
     Whitespace path normalizer
     """
 
+    __slots__ = ()
+
     def normalize(self, path: str) -> str:
         """
         Normalize path
@@ -35,12 +124,47 @@ class WhitespacePathNormalizer(PathNormalizer):
         Returns:
             Represents the normalized path as string
         """
-        path = normpath(path.replace("\\", "/")).rstrip("/")
+        # Already-normalized paths (the common case for callers that round-trip
+        # paths through the Filesystem) skip the cache lookup entirely
+        if (
+            "\\" not in path
+            and "//" not in path
+            and "./" not in path
+            and "/." not in path
+            and not path.endswith("/")
+            and path != "."
+        ):
+            return path
+        return _normalize_impl(path)
 
-        if path == ".":
-            path = ""
+    def normalize_many(self, paths: List[str]) -> List[str]:
+        """
+        Normalize many paths at once
+        Arguments:
+            paths: The paths
+        Returns:
+            The normalized paths, in input order
+        """
+        # Inlined fast-path guard; one list comprehension with the memoized
+        # implementation hoisted to a local instead of a method call per path
+        impl = _normalize_impl
+        return [
+            (
+                path
+                if (
+                    "\\" not in path
+                    and "//" not in path
+                    and "./" not in path
+                    and "/." not in path
+                    and not path.endswith("/")
+                    and path != "."
+                )
+                else impl(path)
+            )
+            for path in paths
+        ]
 
-        if path.startswith("/"):
-            path = "/" + path.lstrip("/")
 
-        return path
+# Shared stateless instance; normalizers carry no per-instance state, so
+# callers that do not pass their own normalizer reuse this one
+DEFAULT_PATH_NORMALIZER = WhitespacePathNormalizer()
@@ -21,17 +21,24 @@ class Visibility(Enum):
 
     @classmethod
     def validate(cls, visibility: str):
-        try:
-            cls(visibility)
-        except Exception:
+        # The str check keeps unhashable input from turning the membership
+        # test into a TypeError; anything invalid gets the documented error
+        if not isinstance(visibility, cls) and not (isinstance(visibility, str) and visibility in _VALUE_MAP):
             raise InvalidVisibilityProvided.with_visibility(visibility)
 
 
+# Value-to-member map built once at import; a plain dict lookup instead of
+# the Enum.__call__ machinery, accepting members themselves as well
+_VALUE_MAP = {member.value: member for member in Visibility}
+
+
 class UnixVisibilityConverter(metaclass=ABCMeta):
     """
     UnixVisibilityConverter interface
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def default_for_directory(self) -> int:
         """
@@ -88,6 +95,38 @@ class PortableUnixVisibilityConverter(UnixVisibilityConverter):
     Portable Unix Visibility Converter class
     """
 
+    __slots__ = (
+        "file_public",
+        "file_private",
+        "directory_public",
+        "directory_private",
+        "default_directory",
+        "_for_file",
+        "_for_directory",
+        "_inverse_file",
+        "_inverse_directory",
+        "_default_directory_mode",
+    )
+
+    def __new__(
+        cls,
+        file_public: int = 0o644,
+        file_private: int = 0o600,
+        directory_public: int = 0o755,
+        directory_private: int = 0o700,
+        default_directory: Visibility = Visibility.PRIVATE,
+    ):
+        # The stock mode constants are by far the common case; specialize to
+        # the subclass whose conversions return literals without table loads
+        if cls is PortableUnixVisibilityConverter and (
+            file_public,
+            file_private,
+            directory_public,
+            directory_private,
+        ) == (0o644, 0o600, 0o755, 0o700):
+            cls = _DefaultPortableUnixVisibilityConverter
+        return object.__new__(cls)
+
     def __init__(
         self,
         file_public: int = 0o644,
@@ -101,6 +140,13 @@ class PortableUnixVisibilityConverter(UnixVisibilityConverter):
         self.directory_public = directory_public
         self.directory_private = directory_private
         self.default_directory = default_directory
+        # Precomputed lookup tables; the .get defaults reproduce the original
+        # branch fallbacks (private modes forward, public visibility inverse)
+        self._for_file = {Visibility.PUBLIC: file_public, Visibility.PRIVATE: file_private}
+        self._for_directory = {Visibility.PUBLIC: directory_public, Visibility.PRIVATE: directory_private}
+        self._inverse_file = {file_private: Visibility.PRIVATE, file_public: Visibility.PUBLIC}
+        self._inverse_directory = {directory_private: Visibility.PRIVATE, directory_public: Visibility.PUBLIC}
+        self._default_directory_mode = directory_public if default_directory == Visibility.PUBLIC else directory_private
 
     def default_for_directory(self) -> int:
         """
@@ -110,7 +156,56 @@ class PortableUnixVisibilityConverter(UnixVisibilityConverter):
         Returns:
             Unix visibility format (int)
         """
-        return self.directory_public if self.default_directory == Visibility.PUBLIC else self.directory_private
+        return self._default_directory_mode
+
+    def for_file(self, visibility: Visibility) -> int:
+        """
+        Convert visibility to Unix visibility for file
+        Arguments:
+            visibility: The file visibility (string format)
+        Returns:
+            Unix visibility format (int)
+        """
+        return self._for_file.get(visibility, self.file_private)
+
+    def for_directory(self, visibility: Visibility) -> int:
+        """
+        Convert visibility to Unix visibility for directory
+        Arguments:
+            visibility: The directory visibility (string format)
+        Returns:
+            Unix visibility format (int)
+        """
+        return self._for_directory.get(visibility, self.directory_private)
+
+    def inverse_for_file(self, visibility: int) -> Visibility:
+        """
+        Convert Unix visibility to visibility for file
+        Arguments:
+            visibility: The file visibility (int format)
+        Returns:
+            The visibility format (string)
+        """
+        return self._inverse_file.get(visibility, Visibility.PUBLIC)
+
+    def inverse_for_directory(self, visibility: int) -> Visibility:
+        """
+        Convert Unix visibility to visibility for directory
+        Arguments:
+            visibility: The directory visibility (int format)
+        Returns:
+            The visibility format (string)
+        """
+        return self._inverse_directory.get(visibility, Visibility.PUBLIC)
+
+
+class _DefaultPortableUnixVisibilityConverter(PortableUnixVisibilityConverter):
+    """
+    Specialization for the stock mode constants (0o644/0o600/0o755/0o700);
+    conversions compare against literals instead of loading instance tables
+    """
+
+    __slots__ = ()
 
     def for_file(self, visibility: Visibility) -> int:
         """
@@ -120,7 +215,7 @@ class PortableUnixVisibilityConverter(UnixVisibilityConverter):
         Returns:
             Unix visibility format (int)
         """
-        return self.file_public if visibility is Visibility.PUBLIC else self.file_private
+        return 0o644 if visibility is Visibility.PUBLIC else 0o600
 
     def for_directory(self, visibility: Visibility) -> int:
         """
@@ -130,7 +225,7 @@ class PortableUnixVisibilityConverter(UnixVisibilityConverter):
         Returns:
             Unix visibility format (int)
         """
-        return self.directory_public if visibility is Visibility.PUBLIC else self.directory_private
+        return 0o755 if visibility is Visibility.PUBLIC else 0o700
 
     def inverse_for_file(self, visibility: int) -> Visibility:
         """
@@ -140,12 +235,7 @@ class PortableUnixVisibilityConverter(UnixVisibilityConverter):
         Returns:
             The visibility format (string)
         """
-        if visibility == self.file_public:
-            return Visibility.PUBLIC
-        elif visibility == self.file_private:
-            return Visibility.PRIVATE
-        # Default
-        return Visibility.PUBLIC
+        return Visibility.PRIVATE if visibility == 0o600 else Visibility.PUBLIC
 
     def inverse_for_directory(self, visibility: int) -> Visibility:
         """
@@ -155,9 +245,4 @@ class PortableUnixVisibilityConverter(UnixVisibilityConverter):
         Returns:
             The visibility format (string)
         """
-        if visibility == self.directory_public:
-            return Visibility.PUBLIC
-        elif visibility == self.directory_private:
-            return Visibility.PRIVATE
-        # Default
-        return Visibility.PUBLIC
+        return Visibility.PRIVATE if visibility == 0o700 else Visibility.PUBLIC
@@ -17,7 +17,12 @@ from flysystem.error import (
     UnableToWriteFile,
 )
 
-filesystem = LocalFilesystemAdapter(".")
+
+@pytest.fixture(scope="session")
+def filesystem() -> LocalFilesystemAdapter:
+    # The raw adapter, not a caching Filesystem wrapper: these tests mutate
+    # state sequentially and assert on unnormalized path errors
+    return LocalFilesystemAdapter(".")
 
 
 @pytest.mark.parametrize(
@@ -28,7 +33,7 @@ filesystem = LocalFilesystemAdapter(".")
         ("/usr/tmp", False, UnableToCreateDirectory),
     ),
 )
-def test_create_directory(path: str, expected: bool, error: Exception):
+def test_create_directory(filesystem, path: str, expected: bool, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.create_directory(path)
@@ -45,7 +50,7 @@ def test_create_directory(path: str, expected: bool, error: Exception):
         ("/usr/tmp.txt", "hello world", UnableToWriteFile),
     ),
 )
-def test_write(path: str, expected: str, error: Exception):
+def test_write(filesystem, path: str, expected: str, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.write(path, expected)
@@ -63,7 +68,7 @@ def test_write(path: str, expected: str, error: Exception):
         ("/usr/tmp.txt", io.StringIO("hello world"), UnableToWriteFile),
     ),
 )
-def test_write_stream(path: str, expected: IO, error: Exception):
+def test_write_stream(filesystem, path: str, expected: IO, error: Exception):
     value = expected.getvalue()
     if error is not None:
         with pytest.raises(error):
@@ -82,7 +87,7 @@ def test_write_stream(path: str, expected: IO, error: Exception):
         ("/usr/tmp", False),
     ),
 )
-def test_file_exists(path: str, expected: bool):
+def test_file_exists(filesystem, path: str, expected: bool):
     assert filesystem.file_exists(path) == expected
 
 
@@ -96,7 +101,7 @@ def test_file_exists(path: str, expected: bool):
         ("/usr/tmp/", False),
     ),
 )
-def test_directory_exists(path: str, expected: str):
+def test_directory_exists(filesystem, path: str, expected: str):
     assert filesystem.directory_exists(path) == expected
 
 
@@ -109,7 +114,7 @@ def test_directory_exists(path: str, expected: str):
         ("/run/sudo", "", UnableToReadFile),
     ),
 )
-def test_read(path: str, expected: str, error: Exception):
+def test_read(filesystem, path: str, expected: str, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.read(path)
@@ -126,7 +131,7 @@ def test_read(path: str, expected: str, error: Exception):
         ("/run/sudo", "", UnableToReadFile),
     ),
 )
-def test_read_stream(path: str, expected: str, error: Exception):
+def test_read_stream(filesystem, path: str, expected: str, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.read_stream(path)
@@ -143,7 +148,7 @@ def test_read_stream(path: str, expected: str, error: Exception):
         ("/usr/tmp.txt", -1, UnableToRetrieveMetadata),
     ),
 )
-def test_file_size(path: str, expected: int, error: Exception):
+def test_file_size(filesystem, path: str, expected: int, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.file_size(path)
@@ -159,7 +164,7 @@ def test_file_size(path: str, expected: int, error: Exception):
         ("/run/sudo", None),
     ),
 )
-def test_mime_type(path: str, expected: str):
+def test_mime_type(filesystem, path: str, expected: str):
     assert filesystem.mime_type(path) == expected
 
 
@@ -170,7 +175,7 @@ def test_mime_type(path: str, expected: str):
         ("resources/tmp", int(time.time() * 1000)),
     ),
 )
-def test_last_modified(path: str, expected: int):
+def test_last_modified(filesystem, path: str, expected: int):
     assert -5 < (expected - filesystem.last_modified(path)) / 1000 / 3600 < 2
 
 
@@ -181,7 +186,7 @@ def test_last_modified(path: str, expected: int):
         ("resources/tmp", ["resources/tmp/tmp.txt"]),
     ),
 )
-def test_list_contents(path: str, expected: str):
+def test_list_contents(filesystem, path: str, expected: str):
     assert filesystem.list_contents(path) == expected
 
 
@@ -195,7 +200,7 @@ def test_list_contents(path: str, expected: str):
         ("/run/sudo", "resources/", UnableToCopyFile),
     ),
 )
-def test_copy(source: str, destination: str, error: Exception):
+def test_copy(filesystem, source: str, destination: str, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.copy(source, destination)
@@ -212,7 +217,7 @@ def test_copy(source: str, destination: str, error: Exception):
         ("/run/sudo", "resources/", UnableToMoveFile),
     ),
 )
-def test_move(source: str, destination: str, error: Exception):
+def test_move(filesystem, source: str, destination: str, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.move(source, destination)
@@ -229,7 +234,7 @@ def test_move(source: str, destination: str, error: Exception):
         ("resources/tmp2/tmp.txt", None),
     ),
 )
-def test_delete(path: str, error: Exception):
+def test_delete(filesystem, path: str, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.delete(path)
@@ -251,7 +256,7 @@ def test_delete(path: str, error: Exception):
         ("resources/", True, None),
     ),
 )
-def test_delete_directory(path: str, expected: bool, error: Exception):
+def test_delete_directory(filesystem, path: str, expected: bool, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.delete_directory(path)
@@ -37,3 +37,27 @@ def test_normalize(path: str, expected: str):
         None
     """
     assert normalizer.normalize(path) == expected
+
+
+@pytest.mark.parametrize("path,expected", paths)
+def test_normalize_is_idempotent(path: str, expected: str):
+    """
+    Test that normalized output takes the unchanged fast path
+    Arguments:
+        path: The path to normalize
+        expected: The expected normalized path
+    Returns:
+        None
+    """
+    assert normalizer.normalize(expected) == expected
+
+
+def test_normalize_many():
+    """
+    Test normalize_many method
+    Arguments:
+        None
+    Returns:
+        None
+    """
+    assert normalizer.normalize_many([path for path, _ in paths]) == [expected for _, expected in paths]
@@ -3,8 +3,6 @@ import os
 import time
 import urllib.request
 
-from typing import IO
-
 import pytest
 
 from flysystem.adapters.s3 import S3FilesystemAdapter
@@ -20,13 +18,19 @@ from flysystem.error import (
     UnableToWriteFile,
 )
 
-filesystem = S3FilesystemAdapter(
-    endpoint_url=os.getenv("AWS_S3_ENDPOINT"),
-    access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-    secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-    bucket_name=os.getenv("AWS_S3_BUCKET"),
-    region_name=os.getenv("AWS_DEFAULT_REGION"),
-)
+
+@pytest.fixture(scope="module")
+def filesystem() -> S3FilesystemAdapter:
+    # One adapter (and one pooled S3 client) for the whole module, built at
+    # first use instead of collection time; the tests build on each other's
+    # bucket state in order, so setup stays inside the tests themselves
+    return S3FilesystemAdapter(
+        endpoint_url=os.getenv("AWS_S3_ENDPOINT"),
+        access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+        secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+        bucket_name=os.getenv("AWS_S3_BUCKET"),
+        region_name=os.getenv("AWS_DEFAULT_REGION"),
+    )
 
 
 @pytest.mark.parametrize(
@@ -36,7 +40,7 @@ filesystem = S3FilesystemAdapter(
         ("/", False, UnableToCreateDirectory),
     ),
 )
-def test_create_directory(path: str, expected: bool, error: Exception):
+def test_create_directory(filesystem, path: str, expected: bool, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.create_directory(path)
@@ -51,8 +55,9 @@ def test_create_directory(path: str, expected: bool, error: Exception):
         ("tests/tmp2.txt", b"hello world", None),
         ("/", b"hello world", UnableToWriteFile),
     ),
+    ids=("str-tmp", "bytes-tmp2", "root-error"),
 )
-def test_write(path: str, expected: str, error: Exception):
+def test_write(filesystem, path: str, expected: str, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.write(path, expected)
@@ -64,23 +69,24 @@ def test_write(path: str, expected: str, error: Exception):
 
 
 @pytest.mark.parametrize(
-    "path,expected,error",
+    "path,payload,error",
     (
-        ("tests/tmp2.txt", io.BytesIO(b"hello world"), None),
-        ("tests/tmp.txt", io.StringIO("hello world"), UnableToWriteFile),
-        ("/", io.BytesIO(b"hello world"), UnableToWriteFile),
+        ("tests/tmp2.txt", b"hello world", None),
+        ("tests/tmp.txt", "hello world", UnableToWriteFile),
+        ("/", b"hello world", UnableToWriteFile),
     ),
+    ids=("bytes-tmp2", "text-stream-error", "root-error"),
 )
-def test_write_stream(path: str, expected: IO, error: Exception):
-    value = expected.getvalue()
+def test_write_stream(filesystem, path: str, payload, error: Exception):
+    # Streams wrap the payload at call time; parametrizing raw payloads keeps
+    # collection cheap and the cases rerunnable
+    stream = io.BytesIO(payload) if isinstance(payload, bytes) else io.StringIO(payload)
     if error is not None:
         with pytest.raises(error):
-            filesystem.write_stream(path, expected)
+            filesystem.write_stream(path, stream)
     else:
-        filesystem.write_stream(path, expected)
-        if isinstance(value, bytes):
-            value = value.decode("utf-8")
-        assert filesystem.read(path) == value
+        filesystem.write_stream(path, stream)
+        assert filesystem.read(path) == payload.decode("utf-8")
 
 
 @pytest.mark.parametrize(
@@ -92,7 +98,7 @@ def test_write_stream(path: str, expected: IO, error: Exception):
         ("/", False, UnableToCheckExistence),
     ),
 )
-def test_file_exists(path: str, expected: bool, error: Exception):
+def test_file_exists(filesystem, path: str, expected: bool, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.file_exists(path)
@@ -109,7 +115,7 @@ def test_file_exists(path: str, expected: bool, error: Exception):
         ("/", True),
     ),
 )
-def test_directory_exists(path: str, expected: str):
+def test_directory_exists(filesystem, path: str, expected: str):
     assert filesystem.directory_exists(path) == expected
 
 
@@ -122,7 +128,7 @@ def test_directory_exists(path: str, expected: str):
         ("/", "", UnableToReadFile),
     ),
 )
-def test_read(path: str, expected: str, error: Exception):
+def test_read(filesystem, path: str, expected: str, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.read(path)
@@ -139,7 +145,7 @@ def test_read(path: str, expected: str, error: Exception):
         ("/", "", UnableToReadFile),
     ),
 )
-def test_read_stream(path: str, expected: str, error: Exception):
+def test_read_stream(filesystem, path: str, expected: str, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.read_stream(path)
@@ -156,7 +162,7 @@ def test_read_stream(path: str, expected: str, error: Exception):
         ("/", -1, UnableToRetrieveMetadata),
     ),
 )
-def test_file_size(path: str, expected: int, error: Exception):
+def test_file_size(filesystem, path: str, expected: int, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.file_size(path)
@@ -172,7 +178,7 @@ def test_file_size(path: str, expected: int, error: Exception):
         ("/", -1, UnableToRetrieveMetadata),
     ),
 )
-def test_mime_type(path: str, expected: str, error: Exception):
+def test_mime_type(filesystem, path: str, expected: str, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.mime_type(path)
@@ -183,16 +189,19 @@ def test_mime_type(path: str, expected: str, error: Exception):
 @pytest.mark.parametrize(
     "path,expected,error",
     (
-        ("tests/tmp.txt", int(time.time() * 1000), None),
+        ("tests/tmp.txt", None, None),
         ("tests/", -1, UnableToRetrieveMetadata),
         ("/", -1, UnableToRetrieveMetadata),
     ),
 )
-def test_last_modified(path: str, expected: int, error: Exception):
+def test_last_modified(filesystem, path: str, expected: int, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.last_modified(path)
     else:
+        # Taken at call time, not at collection time, so the delta stays
+        # meaningful however long the earlier tests ran
+        expected = int(time.time() * 1000)
         assert -5 < (expected - filesystem.last_modified(path)) / 1000 / 3600 < 2
 
 
@@ -203,8 +212,11 @@ def test_last_modified(path: str, expected: int, error: Exception):
         ("tests", ["tests/tmp.txt", "tests/tmp/", "tests/tmp2.txt"]),
     ),
 )
-def test_list_contents(path: str, expected: str):
-    assert filesystem.list_contents(path) == expected
+def test_list_contents(filesystem, path: str, expected: str):
+    # The adapter streams keys as S3 returns them (UTF-8 binary order for
+    # Contents, prefixes first when delimited) without re-sorting; assert
+    # membership rather than pinning that wire ordering
+    assert set(filesystem.list_contents(path)) == set(expected)
 
 
 @pytest.mark.parametrize(
@@ -217,7 +229,7 @@ def test_list_contents(path: str, expected: str):
         ("tests/", None, UnableToGenerateTemporaryUrl),
     ),
 )
-def test_temporary_url(path: str, expected: bytes, error: Exception):
+def test_temporary_url(filesystem, path: str, expected: bytes, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.temporary_url(path)
@@ -238,7 +250,7 @@ def test_temporary_url(path: str, expected: bytes, error: Exception):
         ("/", "tests/", UnableToCopyFile),
     ),
 )
-def test_copy(source: str, destination: str, error: Exception):
+def test_copy(filesystem, source: str, destination: str, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.copy(source, destination)
@@ -255,7 +267,7 @@ def test_copy(source: str, destination: str, error: Exception):
         ("/", "tests/", UnableToMoveFile),
     ),
 )
-def test_move(source: str, destination: str, error: Exception):
+def test_move(filesystem, source: str, destination: str, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.move(source, destination)
@@ -271,7 +283,7 @@ def test_move(source: str, destination: str, error: Exception):
         ("tmp2.txt", None),
     ),
 )
-def test_delete(path: str, error: Exception):
+def test_delete(filesystem, path: str, error: Exception):
     if error is not None:
         with pytest.raises(error):
             filesystem.delete(path)
@@ -289,5 +301,5 @@ def test_delete(path: str, error: Exception):
         ("tests/tmp/", True),
     ),
 )
-def test_delete_directory(path: str, expected: bool):
+def test_delete_directory(filesystem, path: str, expected: bool):
     assert filesystem.delete_directory(path) == expected